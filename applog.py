@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+#
+# 構造化ログ（1行1件のJSON）
+# 出力はキュー経由でバックグラウンドのスレッドが行い、リクエストの処理を待たせない（キューが満杯なら捨てる）。
+# イベントごとの相関ID（correlation_id）を、そのイベントの処理中に出したすべてのログに付ける。
+#
+# Webhookのリクエストボディは LOG_BODY_SAMPLE_RATE（0〜1）の割合だけ記録し、
+# LOG_BODY_REDACT=1（既定）の場合はメッセージ本文・住所を伏せ、ログに含まれるURLのクエリ（住所・座標）も伏せる
+#
+
+import os
+import re
+import sys
+import json
+import uuid
+import queue
+import atexit
+import random
+import logging
+import threading
+import contextvars
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+
+ROOT_LOGGER = "weatherbot"
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', '10000'))
+LOG_BODY_SAMPLE_RATE = float(os.getenv('LOG_BODY_SAMPLE_RATE', '0'))
+LOG_BODY_REDACT = os.getenv('LOG_BODY_REDACT', '1') == '1'
+
+REDACTED = "***"
+# 伏せるメッセージの項目（テキストの本文、位置情報の住所・名称）
+_REDACT_FIELDS = ("text", "address", "title")
+# URLのクエリ（例外のメッセージに含まれる住所検索・リバースジオコーディングのURLなど）
+_QUERY = re.compile(r"\?[^\s?#'\"]*=[^\s'\"]*")
+
+_correlation_id = contextvars.ContextVar("correlation_id", default=None)
+_listener = None
+_lock = threading.Lock()
+_stats = {"dropped": 0}
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record, "%Y-%m-%dT%H:%M:%S%z"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": redact_text(record.getMessage()) if LOG_BODY_REDACT else record.getMessage(),
+        }
+        if getattr(record, "correlation_id", None):
+            entry["correlation_id"] = record.correlation_id
+        entry.update(getattr(record, "fields", None) or {})
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+# ログを出したスレッド・コルーチンの相関IDを記録に付けてからキューに積む
+# キューが満杯の場合は捨てる（ログのためにリクエストの処理を止めない）
+class _QueueHandler(QueueHandler):
+    def prepare(self, record):
+        record.correlation_id = _correlation_id.get()
+        return super().prepare(record)
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            _stats["dropped"] += 1
+
+
+def setup():
+    global _listener
+
+    with _lock:
+        if _listener is not None:
+            return
+
+        log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        output = logging.StreamHandler(sys.stdout)
+        output.setFormatter(JsonFormatter())
+        _listener = QueueListener(log_queue, output)
+
+        logger = logging.getLogger(ROOT_LOGGER)
+        logger.setLevel(LOG_LEVEL)
+        logger.addHandler(_QueueHandler(log_queue))
+        logger.propagate = False
+
+        _listener.start()
+        atexit.register(_listener.stop)
+
+
+def get_logger(name):
+    setup()
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+# with ブロック内のログに相関IDを付ける。指定しない場合は新しく作る
+@contextmanager
+def correlation(correlation_id=None):
+    token = _correlation_id.set(correlation_id or uuid.uuid4().hex)
+    try:
+        yield _correlation_id.get()
+    finally:
+        _correlation_id.reset(token)
+
+
+# イベントの相関ID（Webhookイベントに付いている ID）
+def event_correlation_id(event):
+    return getattr(event, "webhook_event_id", None) or uuid.uuid4().hex
+
+
+def current_correlation_id():
+    return _correlation_id.get()
+
+
+def redact_text(text):
+    return _QUERY.sub("?" + REDACTED, text)
+
+
+def redact_body(body):
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return REDACTED
+
+    for event in data.get("events", []):
+        message = event.get("message") or {}
+        for field in _REDACT_FIELDS:
+            if field in message:
+                message[field] = REDACTED
+    return data
+
+
+# Webhookのリクエストボディを LOG_BODY_SAMPLE_RATE の割合だけ記録する
+def log_body(logger, body):
+    if LOG_BODY_SAMPLE_RATE <= 0 or random.random() >= LOG_BODY_SAMPLE_RATE:
+        return
+
+    logger.info("webhook body", extra={"fields": {"body": redact_body(body) if LOG_BODY_REDACT else body}})
+
+
+def stats():
+    return dict(_stats, queued=_listener.queue.qsize() if _listener is not None else 0)
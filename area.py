@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+#
+# 天気予報 API（livedoor 天気互換）の地域定義 primary_area.xml を扱うモジュール
+# XMLは一度だけ取得・解析し、県名 → [(都市コード, 都市名), ...] の辞書としてプロセス内で保持する
+#
+
+import os
+import sys
+import math
+import threading
+import upstream
+import muni
+import applog
+from lxml import etree
+
+log = applog.get_logger("area")
+
+AREA_XML_URI = f"{upstream.WEATHER_API_BASE_URL}/primary_area.xml"
+
+# 各地域の代表地点の座標（地域名,緯度,経度）
+AREA_COORDS_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), "area_coords.csv")
+
+# 北海道は primary_area.xml 上で道北・道央・道南・道東に分かれている
+HOKKAIDO = "北海道"
+
+# (地域索引, 対応表)。対応表（市区町村コード → 都市コード など。build_tables 参照）は索引と一緒に作り、
+# 参照の付け替えだけでまとめて差し替える（読み手はロック不要）
+_area = None
+_area_lock = threading.Lock()
+
+_area_coords = None
+
+_validators = {"etag": None, "last_modified": None, "content": None}
+
+_refresher_thread = None
+_refresher_stop = threading.Event()
+
+
+# primary_area.xml を解析し、県名 → [(都市コード, 都市名), ...] の辞書を生成
+def build_area_index(xml_bytes):
+    xml_obj = etree.XML(xml_bytes)
+
+    index = {}
+    hokkaido_cities = []
+    for pref in xml_obj.xpath(".//pref"):
+        title = pref.get("title")
+        cities = [(c.get("id"), c.get("title")) for c in pref.xpath("city")]
+        index[title] = cities
+
+        # 道北・道央などは「北海道」でまとめて引けるようにする（旧 contains(@title, '道') 相当）
+        if "道" in title:
+            hokkaido_cities.extend(cities)
+
+    index[HOKKAIDO] = hokkaido_cities
+    return index
+
+
+# 地域定義を取得して索引を生成。取得失敗時は None
+def fetch_area_index():
+    try:
+        resp_area_data = upstream.get(AREA_XML_URI)
+        if resp_area_data.status_code != 200:
+            log.error(f"fetch_area_index: Weather area data request error. \nURI={AREA_XML_URI}\nstatus code={resp_area_data.status_code}")
+            return None
+
+        index = build_area_index(resp_area_data.content)
+        _remember_validators(resp_area_data)
+        return index
+
+    except Exception as e:
+        log.error(f"fetch_area_index: error\n{e}")
+        return None
+
+
+# 条件付きGETで使う検証子（ETag / Last-Modified）と前回取得内容を記録
+def _remember_validators(resp):
+    _validators["etag"] = resp.headers.get("ETag")
+    _validators["last_modified"] = resp.headers.get("Last-Modified")
+    _validators["content"] = resp.content
+
+
+# 地域索引から対応表を作り、索引と一緒に差し替える
+def set_area_index(index):
+    global _area
+
+    _area = (index, build_tables(index))
+
+
+# (地域索引, 対応表) を返す。未読込の場合のみ取得する（失敗時は次回呼び出しで再試行）
+# fetch=False の場合は取得せず、未読込なら None（イベントループ上など、上流APIを待てない呼び出し元用）
+def _get_area(fetch=True):
+    current = _area
+    if current is not None or not fetch:
+        return current
+
+    with _area_lock:
+        if _area is None:
+            index = fetch_area_index()
+            if index is not None:
+                set_area_index(index)
+        return _area
+
+
+def get_area_index(fetch=True):
+    current = _get_area(fetch)
+    return current[0] if current is not None else None
+
+
+# 地域定義を条件付きGETで再検証し、内容が変わっていれば索引を差し替える
+# 上流のエラー時は既存の索引をそのまま使い続ける。差し替えた場合 True
+def refresh_area_index():
+    headers = {}
+    if _validators["etag"]:
+        headers["If-None-Match"] = _validators["etag"]
+    if _validators["last_modified"]:
+        headers["If-Modified-Since"] = _validators["last_modified"]
+
+    try:
+        resp_area_data = upstream.get(AREA_XML_URI, headers=headers)
+        if resp_area_data.status_code == 304:
+            return False
+
+        if resp_area_data.status_code != 200:
+            log.error(f"refresh_area_index: Weather area data request error. \nURI={AREA_XML_URI}\nstatus code={resp_area_data.status_code}")
+            return False
+
+        if _area is not None and resp_area_data.content == _validators["content"]:
+            # 検証子非対応でも内容が同じなら解析し直さない
+            _remember_validators(resp_area_data)
+            return False
+
+        index = build_area_index(resp_area_data.content)
+
+    except Exception as e:
+        log.error(f"refresh_area_index: error\n{e}")
+        return False
+
+    # 対応表も作り直してから、索引と一緒に差し替える（リクエストの処理中には作らない）
+    with _area_lock:
+        set_area_index(index)
+        _remember_validators(resp_area_data)
+
+    log.info(f"refresh_area_index: area index updated ({len(index)} prefectures)")
+    return True
+
+
+def _refresher_loop(interval):
+    # 起動直後に一度読み込んでおき、以降は一定間隔で再検証する
+    get_area_index()
+    while not _refresher_stop.wait(interval):
+        refresh_area_index()
+
+
+# 地域定義のバックグラウンド更新スレッドを起動（二重起動はしない）
+def start_refresher(interval=3600):
+    global _refresher_thread
+
+    if _refresher_thread is not None and _refresher_thread.is_alive():
+        return _refresher_thread
+
+    _refresher_stop.clear()
+    _refresher_thread = threading.Thread(target=_refresher_loop, args=(interval,), name="area-refresher", daemon=True)
+    _refresher_thread.start()
+    return _refresher_thread
+
+
+def stop_refresher():
+    _refresher_stop.set()
+
+
+# 県名から天気予報APIの都市リスト [(都市コード, 都市名), ...] を取得
+def get_cities(prefecture):
+    index = get_area_index()
+    if index is None:
+        return []
+
+    return index.get(prefecture, [])
+
+
+# 市区町村名に地域名を含む地域の都市コードを返す。無い場合は ""
+def match_city_code(cities, city):
+    for c_id, c_title in cities:
+        if c_title in city:
+            return c_id
+    return ""
+
+
+# 市区町村名に地域名を含む地域の都市コードを返す
+# 都市名が1件もヒットしない場合、最初の都市の予報情報を表示
+def select_city_code(cities, city):
+    if len(cities) == 0:
+        return ""
+    return match_city_code(cities, city) or cities[0][0]
+
+
+# 地域の代表地点の座標（地域名 → (緯度, 経度)）
+def load_area_coords(path=AREA_COORDS_CSV):
+    coords = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if line == "":
+                continue
+            title, lat, lon = line.split(",")
+            coords[title] = (float(lat), float(lon))
+    return coords
+
+
+def _get_area_coords():
+    global _area_coords
+
+    if _area_coords is None:
+        try:
+            _area_coords = load_area_coords()
+        except Exception as e:
+            log.error(f"load_area_coords: error\n{e}")
+            _area_coords = {}
+    return _area_coords
+
+
+# 県名 → [(都市コード, 緯度, 経度), ...]（座標の分かる地域のみ）
+def build_area_points(index, coords):
+    points = {}
+    for prefecture, cities in index.items():
+        points[prefecture] = [(c_id, *coords[c_title]) for c_id, c_title in cities if c_title in coords]
+    return points
+
+
+# 地点のリストから最も近い地域の都市コードを返す。無い場合は ""
+# 地域は1県あたり高々十数件なので、経度方向を緯度で補正した平面距離で線形に探す
+def nearest_city_code(points, lat, lon):
+    lat = float(lat)
+    lon = float(lon)
+    scale = math.cos(math.radians(lat))
+
+    city_code = ""
+    nearest = None
+    for c_id, c_lat, c_lon in points:
+        distance = (lat - c_lat) ** 2 + ((lon - c_lon) * scale) ** 2
+        if nearest is None or distance < nearest:
+            city_code = c_id
+            nearest = distance
+    return city_code
+
+
+# 市区町村コード → 天気予報APIの都市コード の対応表を生成
+# 市区町村一覧（muni.csv）と地域定義のどちらかが変われば作り直す
+def build_city_code_table(index):
+    table = {}
+    for municipality in muni.municipalities():
+        cities = index.get(municipality.prefecture, [])
+        if len(cities) > 0:
+            table[municipality.code] = select_city_code(cities, municipality.name)
+    return table
+
+
+# 地域名が市区町村名に含まれない市区町村 → 県名
+# これらは位置が分かる場合、県内で最も近い地域の予報を使う
+def build_fallback_table(index):
+    table = {}
+    for municipality in muni.municipalities():
+        cities = index.get(municipality.prefecture, [])
+        if len(cities) > 0 and match_city_code(cities, municipality.name) == "":
+            table[municipality.code] = municipality.prefecture
+    return table
+
+
+# 地域索引から引く対応表
+#   city_code: 市区町村コード → 都市コード, fallback: 位置から地域を選ぶ市区町村 → 県名,
+#   points: 県名 → 地域の代表地点
+def build_tables(index):
+    return {
+        "city_code": build_city_code_table(index),
+        "fallback": build_fallback_table(index),
+        "points": build_area_points(index, _get_area_coords()),
+    }
+
+
+# 地域定義 index に対する 市区町村コード → 都市コード の対応表
+def city_code_table(index):
+    current = _area
+    if current is not None and current[0] is index:
+        return current[1]["city_code"]
+    return build_city_code_table(index)
+
+
+# 市区町村名から地域を決められず、位置から最も近い地域を選ぶ市区町村か
+def needs_position(muni_cd, fetch=True):
+    current = _get_area(fetch)
+    if current is None:
+        return False
+
+    return str(int(muni_cd)) in current[1]["fallback"]
+
+
+# 市区町村コードから天気予報APIの都市コードを取得。該当なしの場合は ""
+# 緯度・経度を指定した場合、市区町村名から地域を決められなければ最も近い地域を選ぶ
+# fetch=False の場合、地域定義が未読込でも取得しない（get_area_index 参照）
+def get_city_code(muni_cd, lat=None, lon=None, fetch=True):
+    current = _get_area(fetch)
+    if current is None:
+        return ""
+
+    muni_cd = str(int(muni_cd))
+    joined = current[1]
+    if lat is not None and lon is not None and muni_cd in joined["fallback"]:
+        city_code = nearest_city_code(joined["points"][joined["fallback"][muni_cd]], lat, lon)
+        if city_code != "":
+            return city_code
+
+    return joined["city_code"].get(muni_cd, "")
+
+
+# 対応表を CSV で出力する（確認用）
+#   $ python area.py [primary_area.xml] > muni_city.csv
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], "rb") as f:
+            area_index = build_area_index(f.read())
+    else:
+        area_index = fetch_area_index()
+
+    city_titles = {c_id: c_title for cities in area_index.values() for c_id, c_title in cities}
+    for muni_cd, c_id in build_city_code_table(area_index).items():
+        municipality = muni.get(muni_cd)
+        print(f"{muni_cd},{c_id},{municipality.prefecture},{municipality.name},{city_titles[c_id]}")
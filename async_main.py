@@ -0,0 +1,408 @@
+# -*- coding: utf-8 -*-
+#
+# asyncio 版のエントリポイント（ASGI）
+# 住所検索 → リバースジオコーディング → 天気予報取得 → 返信 をコルーチンで実行し、
+# スレッドを増やさずに多数のリクエストを同時に処理する。
+# 返信内容は main.py（Flask版）と同一。Flask版はそのまま従来どおり利用できる
+#
+#   $ uvicorn async_main:app --host 0.0.0.0 --port $PORT
+#
+
+import asyncio
+import aiohttp
+from linebot import AsyncLineBotApi
+from linebot.aiohttp_async_http_client import AiohttpAsyncHttpClient
+from linebot.exceptions import InvalidSignatureError, LineBotApiError
+from linebot.models import MessageEvent, TextMessage, LocationMessage, TextSendMessage
+
+import main
+import area
+import forecast
+import upstream
+import worker
+import revgeo
+import query
+import placename
+import singleflight
+import deadline
+import metrics
+import async_upstream
+import applog
+
+log = applog.get_logger("async_main")
+
+line_bot_api = None
+# 送信待ちのプッシュメッセージ（完了前に破棄されないよう参照を持っておく）
+_push_tasks = set()
+
+# 同じキーへの同時リクエストは上流APIを1回だけ呼ぶ（Flask版とは別に、イベントループ内でまとめる）
+forecast_flight = singleflight.AsyncGroup("forecast")
+area_flight = singleflight.AsyncGroup("area")
+reverse_geocode_flight = singleflight.AsyncGroup("reverse_geocode")
+address_search_flight = singleflight.AsyncGroup("address_search")
+
+
+# テキストメッセージハンドラ（main.handle_message と同じ処理）
+async def handle_message(event):
+    log.debug("callback start")
+    if main.is_subscription_command(event.message.text):
+        # 配信登録・解除はまれなので、Flask版の処理を別スレッドで行う
+        await respond(event, lambda: asyncio.get_running_loop().run_in_executor(
+            None, main.create_messages_from_subscription_command, event.source.user_id, event.message.text))
+        return
+
+    await respond(event, lambda: create_messages_from_text(event.message.text))
+
+
+async def create_messages_from_text(text):
+    try:
+        # 検索結果候補
+        geo_info = await get_geo_info_from_text(text)
+        city_code, weather_data = "", {}
+        if len(geo_info) == 1:
+            city_code, weather_data = await get_weather_from_geo_info(geo_info[0])
+
+        return main.create_messages_from_geo_info(geo_info, weather_data, city_code)
+
+    except Exception as e:
+        log.error(f"handle_message error\n{e}")
+        return TextSendMessage(text=main.NG_MESSAGE)
+
+
+# ロケーションメッセージハンドラ（main.handle_image_message と同じ処理）
+async def handle_image_message(event):
+    await respond(event, lambda: create_messages_from_location(event.message.latitude, event.message.longitude))
+
+
+async def create_messages_from_location(lat, lon):
+    try:
+        city_code, weather_data = await get_weather_from_geocode(lat, lon)
+        return main.create_messages_from_weather_data(weather_data, city_code)
+
+    except Exception as e:
+        log.error(f"handle_image_message error\n{e}")
+        return TextSendMessage(text=main.NG_MESSAGE)
+
+
+# main.respond の非同期版
+async def respond(event, create_messages):
+    if not main.PUSH_FALLBACK:
+        await reply_message(event.reply_token, await create_messages())
+        return
+
+    task = asyncio.ensure_future(_create_messages_without_deadline(create_messages))
+    done, _ = await asyncio.wait({task}, timeout=main.PUSH_FALLBACK_AFTER)
+    if not done:
+        if main.PUSH_INTERIM_MESSAGE:
+            await reply_message(event.reply_token, TextSendMessage(text=main.PUSH_INTERIM_MESSAGE))
+        push_task = asyncio.ensure_future(_push_when_ready(main.push_target(event), task))
+        _push_tasks.add(push_task)
+        push_task.add_done_callback(_push_tasks.discard)
+        return
+
+    if not await reply_message(event.reply_token, task.result()):
+        await push_message(main.push_target(event), task.result())
+
+
+# 後からプッシュメッセージで送る処理には処理期限を引き継がない
+async def _create_messages_without_deadline(create_messages):
+    deadline.clear()
+    return await create_messages()
+
+
+# main._push_when_done の非同期版
+async def _push_when_ready(to, task):
+    try:
+        messages = await task
+    except Exception as e:
+        log.error(f"push fallback error\n{e}")
+        messages = TextSendMessage(text=main.NG_MESSAGE)
+    await push_message(to, messages)
+
+
+# 返信（main.reply_message と同じく、処理期限を使い切っている場合は送らずに False）
+async def reply_message(reply_token, messages):
+    try:
+        with deadline.stage("reply"), metrics.timed("reply"):
+            await asyncio.wait_for(line_bot_api.reply_message(reply_token, messages=messages), deadline.timeout())
+        return True
+    except (deadline.DeadlineExceeded, asyncio.TimeoutError, LineBotApiError, aiohttp.ClientError) as e:
+        log.error(f"reply_message error\n{e!r}")
+        return False
+
+
+async def push_message(to, messages):
+    try:
+        await line_bot_api.push_message(to, messages=messages)
+    except Exception as e:
+        log.error(f"push_message error\n{e}")
+
+
+async def get_geo_info_from_text(address_text):
+    try:
+        with metrics.timed("address_search"):
+            # 地名だけの問い合わせはローカルの索引で解決する
+            await load_area_index()
+            geo_info = placename.search(address_text, fetch=False)
+            if geo_info is not None:
+                return geo_info
+
+            normalized = query.normalize_query(address_text)
+            geo_info = main.address_search_cache.get(normalized)
+            if geo_info is not None:
+                return geo_info
+
+            with deadline.stage("geocode"):
+                return await asyncio.wait_for(address_search_flight.do(normalized, lambda: search_address(normalized)),
+                                              deadline.timeout())
+    except (asyncio.TimeoutError, deadline.DeadlineExceeded):
+        # 時間切れは「該当する住所が見つかりません」ではなくエラーとして返信する
+        raise
+    except Exception as e:
+        log.error(f"get_weather_from_text error: '{e}'")
+        return {}
+
+
+async def search_address(normalized):
+    request_uri = main.address_search_uri(normalized)
+    resp_data = await async_upstream.get(request_uri)
+    if resp_data.status_code != 200:
+        log.error(f"get_weather_from_text error: Weather area data request error. \nendpoint={upstream.endpoint(request_uri)}\nstatus code={resp_data.status_code}")
+        metrics.error("address_search")
+        return {}
+
+    geo_info = resp_data.json()
+    main.address_search_cache.put(normalized, geo_info)
+    return geo_info
+
+
+async def reverse_geocode(lat, lon):
+    try:
+        # 市区町村界データがあれば、APIを呼ばずにローカルで判定する
+        muni_cd = revgeo.lookup(lat, lon)
+        if muni_cd is not None:
+            muni_cd = main.validate_muni_cd(muni_cd)
+            if muni_cd != "":
+                return muni_cd
+
+        if not main.reverse_geocode_api_fallback:
+            log.error("reverse_geocode error. Out of local boundary data.")
+            metrics.error("reverse_geocode")
+            return ""
+
+        req_uri = main.reverse_geocode_uri(lat, lon)
+        resp_rev_geo = await async_upstream.get(req_uri)
+
+        if resp_rev_geo.status_code != 200:
+            log.error(f"reverse_geocode error\nendpoint = {upstream.endpoint(req_uri)}\nstatus_code={resp_rev_geo.status_code}")
+            metrics.error("reverse_geocode")
+            return ""
+
+        rev_geo_data = resp_rev_geo.json()
+        if len(rev_geo_data) == 0:
+            log.error("reverse_geocode error. Invalid get data.")
+            metrics.error("reverse_geocode")
+            return ""
+
+        muni_cd = main.validate_muni_cd(rev_geo_data['results']['muniCd'])
+        if muni_cd == "":
+            metrics.error("reverse_geocode")
+        return muni_cd
+
+    except Exception as e:
+        log.error(f"reverse_geocode error\n{e}")
+        metrics.error("reverse_geocode")
+        return ""
+
+
+async def get_weather_from_geo_info(geo):
+    try:
+        properties = geo["properties"]
+        if "cityCode" in properties:
+            with metrics.timed("forecast"):
+                return properties["cityCode"], await get_forecast(properties["cityCode"])
+
+        if "muniCd" in properties:
+            return await get_weather_from_muni_cd(properties["muniCd"])
+
+        lon, lat = geo["geometry"]["coordinates"]
+        return await get_weather_from_geocode(lat, lon)
+
+    except Exception as e:
+        log.error(f"get_weather_from_geo_info: error\n{e}")
+        return "", {}
+
+
+async def get_weather_from_geocode(lat, lon):
+    try:
+        with metrics.timed("reverse_geocode"):
+            muni_cd = main.get_cached_muni_cd(lat, lon)
+            if muni_cd is None:
+                with deadline.stage("reverse_geocode"):
+                    muni_cd = await asyncio.wait_for(reverse_geocode_flight.do((lat, lon), lambda: reverse_geocode(lat, lon)),
+                                                     deadline.timeout())
+                main.store_muni_cd(lat, lon, muni_cd)
+
+        if muni_cd == "":
+            return "", {}
+
+        return await get_weather_from_muni_cd(muni_cd, lat, lon)
+
+    except Exception as e:
+        log.error(f"get_weather_from_geocode: error\n{e}")
+        return "", {}
+
+
+async def get_weather_from_muni_cd(muni_cd, lat=None, lon=None):
+    # 天気予報API用の都市コード取得（市区町村コードとの対応表、または位置から最も近い地域）
+    with metrics.timed("area_lookup"):
+        await load_area_index()
+        city_code = area.get_city_code(muni_cd, lat, lon, fetch=False)
+    if city_code == "":
+        log.warning(f"get_weather_from_geocode: No forecast area for muni cd '{muni_cd}'")
+        return "", {}
+
+    # 天気予報APIリクエスト（発表時刻まではキャッシュから返す）
+    with metrics.timed("forecast"):
+        return city_code, await get_forecast(city_code)
+
+
+# 地域定義が未読込（起動時の取得に失敗した場合など）なら別スレッドで取得する
+# イベントループ上では上流APIを待たない。同時に呼ばれた場合は1回だけ取得する
+async def load_area_index():
+    if area.get_area_index(fetch=False) is not None:
+        return
+
+    loop = asyncio.get_running_loop()
+    await area_flight.do("area", lambda: loop.run_in_executor(None, area.get_area_index))
+
+
+# forecast.get_forecast の非同期版（キャッシュは Flask 版と共有）
+async def get_forecast(city_code):
+    weather_data = forecast.get_cached_forecast(city_code)
+    if weather_data is not None:
+        return weather_data
+
+    stale = forecast.get_stale_forecast(city_code)
+    if stale is not None and upstream.is_open(forecast.FORECAST_URI):
+        # サーキットブレーカーが開いている間は上流を待たない
+        return stale
+
+    try:
+        with deadline.stage("forecast"):
+            weather_data = await asyncio.wait_for(forecast_flight.do(city_code, lambda: fetch_and_store_forecast(city_code)),
+                                                  deadline.timeout())
+    except Exception as e:
+        log.error(f"get_forecast: error\n{e}")
+        weather_data = {}
+
+    if len(weather_data) == 0:
+        metrics.error("forecast")
+    if len(weather_data) == 0 and stale is not None:
+        return stale
+    return weather_data
+
+
+async def fetch_and_store_forecast(city_code):
+    resp_weather = await async_upstream.get(forecast.forecast_uri(city_code))
+    weather_data = forecast.parse_forecast(city_code, resp_weather)
+    if len(weather_data) != 0:
+        forecast.store_forecast(city_code, weather_data)
+    return weather_data
+
+
+# イベント振り分け（main.dispatch_event と対応させること）
+async def dispatch_event(event):
+    try:
+        with applog.correlation(applog.event_correlation_id(event)), deadline.event(event), metrics.timed("event"):
+            if isinstance(event, MessageEvent):
+                if isinstance(event.message, TextMessage):
+                    await handle_message(event)
+                elif isinstance(event.message, LocationMessage):
+                    await handle_image_message(event)
+    except Exception as e:
+        log.error(f"dispatch_event error\n{e}")
+
+
+async def _run_in_order(events):
+    for event in events:
+        await dispatch_event(event)
+
+
+async def callback(body, signature):
+    with metrics.timed("signature"):
+        events = main.handler.parser.parse(body, signature)
+
+    # 送信元ごとに並行処理する（同じ送信元は受信順）
+    await asyncio.gather(*(_run_in_order(group) for group in worker.group_by_source(events)))
+
+
+async def startup():
+    global line_bot_api
+
+    session = await async_upstream.open_session()
+    line_bot_api = AsyncLineBotApi(main.channel_access_token, AiohttpAsyncHttpClient(session),
+                                   endpoint=main.LINE_API_ENDPOINT)
+
+    # 地域定義の初回読込はイベントループを止めないよう別スレッドで行う
+    await asyncio.get_running_loop().run_in_executor(None, area.get_area_index)
+
+
+async def shutdown():
+    await async_upstream.close_session()
+
+
+async def _read_body(receive):
+    body = b""
+    more_body = True
+    while more_body:
+        message = await receive()
+        body += message.get("body", b"")
+        more_body = message.get("more_body", False)
+    return body
+
+
+async def _send_response(send, status, text):
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", b"text/plain; charset=utf-8")],
+    })
+    await send({"type": "http.response.body", "body": text.encode("utf-8")})
+
+
+# ASGIアプリケーション
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await startup()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    if scope["type"] != "http":
+        return
+
+    if scope["path"] != "/callback" or scope["method"] != "POST":
+        await _send_response(send, 404, "Not Found")
+        return
+
+    headers = dict(scope["headers"])
+    signature = headers.get(b"x-line-signature", b"").decode("utf-8")
+    body = (await _read_body(receive)).decode("utf-8")
+
+    # POSTデータをログに出力（LOG_BODY_SAMPLE_RATE の割合だけ。本文は伏せる）
+    applog.log_body(log, body)
+
+    try:
+        await callback(body, signature)
+    except InvalidSignatureError:
+        log.warning("callback: invalid signature")
+        await _send_response(send, 400, "Bad Request")
+        return
+
+    await _send_response(send, 200, "OK")
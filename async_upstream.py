@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+#
+# 上流API（国土地理院、天気予報API）への非同期HTTPクライアント
+# async_main から利用する。aiohttp のセッションを1つ共有し、ホストごとに接続を使い回す
+#
+
+import json
+import time
+import asyncio
+import urllib.parse
+import aiohttp
+import upstream
+import deadline
+
+_session = None
+
+
+# requests.Response と同じ属性名で扱えるようにした応答
+class Response:
+    def __init__(self, status_code, content, headers):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8")
+
+    def json(self):
+        return json.loads(self.content)
+
+
+# イベントループ上でセッションを開く（ASGIの起動時に呼び出す）
+async def open_session():
+    global _session
+
+    if _session is None:
+        _session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit_per_host=upstream.POOL_SIZE))
+    return _session
+
+
+async def close_session():
+    global _session
+
+    if _session is not None:
+        await _session.close()
+        _session = None
+
+
+# サーキットブレーカー・呼び出し統計は Flask 版（upstream）と共有する。タイムアウトはイベントの処理期限の残り時間まで
+# 処理期限で短くしたタイムアウトでの打ち切り・呼び出し元による取り消しは、サーキットブレーカーの失敗に数えない
+async def get(url, **kwargs):
+    host = urllib.parse.urlsplit(url).netloc
+    shortened = False
+    if "timeout" not in kwargs:
+        timeout = deadline.timeout(upstream.TIMEOUT)
+        kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+        shortened = timeout < upstream.TIMEOUT
+    breaker = upstream.get_breaker(host)
+    if not breaker.allow():
+        raise upstream.CircuitOpenError(f"circuit open: {host}")
+
+    session = await open_session()
+    start = time.perf_counter()
+    error = True
+    judged = True
+    try:
+        async with session.get(url, **kwargs) as resp:
+            content = await resp.read()
+            error = resp.status >= 500
+            return Response(resp.status, content, resp.headers)
+    except asyncio.TimeoutError:
+        judged = not shortened
+        raise
+    except asyncio.CancelledError:
+        judged = False
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        if judged:
+            breaker.record(not error, elapsed)
+        else:
+            breaker.release()
+        upstream.record(host, elapsed, error)
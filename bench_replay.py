@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+#
+# Webhookのリプレイによるベンチマーク（オフラインで実行できる）
+# 記録したWebhookのリクエストボディ（または生成した擬似トラフィック）に正しい署名を付けて
+# Flask版（main.app）の /callback に送り、イベント種別（テキスト・位置情報）ごとの
+# スループット・レイテンシ（p50/p95/p99）と上流APIの呼び出し回数を出力する。
+# 上流API（国土地理院・天気予報API）とLINE Messaging APIはプロセス内のスタブに置き換える。
+# --upstream を指定した場合は上流APIに fakeupstream.py などの代替サーバーを使う（HTTP通信を含めて計測する）
+#
+#   $ python bench_replay.py                          # 擬似トラフィック 1000 件
+#   $ python bench_replay.py --input webhooks.jsonl   # 記録したリクエストボディ（1行1件）
+#   $ python bench_replay.py --requests 5000 --concurrency 8 --upstream-latency 50 --json
+#   $ python bench_replay.py --upstream http://127.0.0.1:8080     # 代替サーバー（python fakeupstream.py）
+#
+# 入力ファイルは1行に1件、Webhookのリクエストボディ（{"destination": ..., "events": [...]}）
+# またはイベント1件の JSON を書く。送信時に timestamp は現在時刻に置き換える
+#
+
+import os
+import sys
+import json
+import time
+import hmac
+import base64
+import random
+import hashlib
+import argparse
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, parse_qs
+import fakeupstream
+
+CHANNEL_SECRET = "bench-secret"
+
+
+class StubResponse:
+    def __init__(self, status_code, content, headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8")
+
+    def json(self):
+        return json.loads(self.content)
+
+
+# 上流APIのスタブ（upstream.get の代わり）。fakeupstream と同じ固定データを HTTP を介さずに返し、呼び出し回数を数える
+class UpstreamStub:
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = Counter()
+        self._lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        parts = urlsplit(url)
+        query = parse_qs(parts.query)
+        with self._lock:
+            self.calls[f"{parts.netloc}{parts.path}"] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        status, content_type, content = fakeupstream.respond(fakeupstream.service_for(parts.path), query)
+        return StubResponse(status, content, {"Content-Type": content_type})
+
+
+# LINE Messaging API のスタブ（LineBotApi の http_client の代わり）
+class LineApiStub:
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.timeout = 5
+        self.calls = Counter()
+        self._lock = threading.Lock()
+
+    def post(self, url, headers=None, data=None, timeout=None):
+        with self._lock:
+            self.calls[urlsplit(url).path] += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return StubResponse(200, b"{}")
+
+    def get(self, url, headers=None, params=None, stream=False, timeout=None):
+        return self.post(url)
+
+
+# スタブを組み込んで main を読み込む（main の読み込み前に環境変数とスタブを設定する）
+# upstream_url を指定した場合は上流APIをスタブに置き換えず、その URL に接続する
+def load_app(upstream_stub, line_stub, upstream_url=None):
+    os.environ.setdefault('LINE_CHANNEL_SECRET', CHANNEL_SECRET)
+    os.environ.setdefault('LINE_CHANNEL_ACCESS_TOKEN', "bench-token")
+    os.environ.setdefault('LOG_LEVEL', "WARNING")
+    for name in ('WEBHOOK_ASYNC', 'FORECAST_PREWARM', 'SUBSCRIPTION_DELIVERY', 'PUSH_FALLBACK'):
+        os.environ[name] = '0'
+
+    if upstream_url:
+        for name in ('ADDRESS_SEARCH_BASE_URL', 'REVERSE_GEOCODER_BASE_URL', 'WEATHER_API_BASE_URL'):
+            os.environ[name] = upstream_url
+
+    import upstream
+    if not upstream_url:
+        upstream.get = upstream_stub.get
+
+    import main
+    main.line_bot_api.http_client = line_stub
+    return main
+
+
+def _event_base(i, user_id):
+    return {"type": "message", "replyToken": f"bench-reply-{i}", "mode": "active",
+            "source": {"type": "user", "userId": user_id}, "timestamp": 0,
+            "webhookEventId": f"bench-{i}", "deliveryContext": {"isRedelivery": False}}
+
+
+# 擬似トラフィック（テキスト：地名・住所、位置情報：主要都市の周辺）
+def synthetic_bodies(count, text_ratio=0.5, users=100, seed=0):
+    rng = random.Random(seed)
+    texts = [place[5] for place in fakeupstream.PLACES] + [f"{place[0]}{rng.randint(1, 5)}丁目" for place in fakeupstream.PLACES]
+    bodies = []
+    for i in range(count):
+        event = _event_base(i, f"U{rng.randrange(users):032d}")
+        if rng.random() < text_ratio:
+            event["message"] = {"type": "text", "id": str(i), "text": rng.choice(texts)}
+        else:
+            place = rng.choice(fakeupstream.PLACES)
+            event["message"] = {"type": "location", "id": str(i), "address": place[0],
+                                "latitude": place[1] + rng.uniform(-0.05, 0.05),
+                                "longitude": place[2] + rng.uniform(-0.05, 0.05)}
+        bodies.append({"destination": "bench", "events": [event]})
+    return bodies
+
+
+def load_bodies(path):
+    bodies = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip() == "":
+                continue
+            data = json.loads(line)
+            if "events" not in data:
+                data = {"destination": "bench", "events": [data]}
+            bodies.append(data)
+    return bodies
+
+
+# イベント種別（1件のボディに複数種類あれば「+」でつなぐ）
+def body_type(body):
+    types = sorted({(event.get("message") or {}).get("type", event.get("type", "unknown")) for event in body["events"]})
+    return "+".join(types) or "empty"
+
+
+def sign(body_text, secret):
+    return base64.b64encode(hmac.new(secret.encode("utf-8"), body_text.encode("utf-8"), hashlib.sha256).digest()).decode("utf-8")
+
+
+def percentile(values, p):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, max(0, int(round(p / 100 * len(values))) - 1))]
+
+
+# ボディを送り、(種別, 所要時間, ステータスコード) のリストを返す
+def replay(app, secret, bodies, concurrency):
+    local = threading.local()
+
+    def send(body):
+        client = getattr(local, "client", None)
+        if client is None:
+            client = local.client = app.test_client()
+
+        now = int(time.time() * 1000)
+        for event in body["events"]:
+            event["timestamp"] = now
+        body_text = json.dumps(body, ensure_ascii=False)
+        headers = {"X-Line-Signature": sign(body_text, secret), "Content-Type": "application/json"}
+
+        start = time.perf_counter()
+        resp = client.post("/callback", data=body_text.encode("utf-8"), headers=headers)
+        return body_type(body), time.perf_counter() - start, resp.status_code
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(send, bodies))
+
+
+# upstream.stats() のホストごとの呼び出し回数
+def upstream_request_counts():
+    import upstream
+    return Counter({host: stat["requests"] for host, stat in upstream.stats().items()})
+
+
+def summarize(results, elapsed, upstream_calls, line_stub):
+    by_type = {}
+    for kind, seconds, _ in results:
+        by_type.setdefault(kind, []).append(seconds)
+
+    return {
+        "requests": len(results),
+        "errors": sum(1 for _, _, status in results if status != 200),
+        "elapsed": elapsed,
+        "throughput": len(results) / elapsed if elapsed else 0.0,
+        "latency_ms": {kind: {"count": len(values),
+                              "p50": percentile(values, 50) * 1000,
+                              "p95": percentile(values, 95) * 1000,
+                              "p99": percentile(values, 99) * 1000,
+                              "mean": sum(values) / len(values) * 1000} for kind, values in sorted(by_type.items())},
+        "upstream_calls": dict(sorted(upstream_calls.items())),
+        "line_api_calls": dict(sorted(line_stub.calls.items())),
+    }
+
+
+def print_report(report, concurrency):
+    print(f"requests: {report['requests']}  errors: {report['errors']}  concurrency: {concurrency}  "
+          f"elapsed: {report['elapsed']:.2f}s  throughput: {report['throughput']:.1f} req/s")
+    print(f"{'type':<20}{'count':>8}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}{'mean(ms)':>10}")
+    for kind, stat in report["latency_ms"].items():
+        print(f"{kind:<20}{stat['count']:>8}{stat['p50']:>10.2f}{stat['p95']:>10.2f}{stat['p99']:>10.2f}{stat['mean']:>10.2f}")
+    print("upstream calls:")
+    for endpoint, count in report["upstream_calls"].items():
+        print(f"  {endpoint:<60}{count:>8}")
+    print("LINE API calls:")
+    for path, count in report["line_api_calls"].items():
+        print(f"  {path:<60}{count:>8}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay webhook bodies against the Flask app with stubbed upstreams.")
+    parser.add_argument("--input", help="JSONL file of recorded webhook bodies (default: synthetic traffic)")
+    parser.add_argument("--requests", type=int, default=1000, help="number of synthetic requests")
+    parser.add_argument("--text-ratio", type=float, default=0.5, help="share of text messages in synthetic traffic")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--warmup", type=int, default=0, help="requests sent before measuring")
+    parser.add_argument("--upstream-latency", type=float, default=0.0, help="stub upstream latency (ms)")
+    parser.add_argument("--upstream", help="base URL of a stand-in upstream server instead of the in-process stub")
+    parser.add_argument("--line-latency", type=float, default=0.0, help="stub LINE API latency (ms)")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    upstream_stub = UpstreamStub(args.upstream_latency / 1000)
+    line_stub = LineApiStub(args.line_latency / 1000)
+    app_module = load_app(upstream_stub, line_stub, args.upstream)
+
+    if args.input:
+        bodies = load_bodies(args.input)
+    else:
+        bodies = synthetic_bodies(args.requests + args.warmup, args.text_ratio, seed=args.seed)
+
+    if args.warmup:
+        replay(app_module.app, app_module.channel_secret, bodies[:args.warmup], args.concurrency)
+        bodies = bodies[args.warmup:]
+        upstream_stub.calls.clear()
+        line_stub.calls.clear()
+
+    upstream_before = upstream_request_counts()
+    start = time.perf_counter()
+    results = replay(app_module.app, app_module.channel_secret, bodies, args.concurrency)
+    elapsed = time.perf_counter() - start
+    if args.upstream:
+        upstream_calls = upstream_request_counts() - upstream_before
+    else:
+        upstream_calls = upstream_stub.calls
+    report = summarize(results, elapsed, upstream_calls, line_stub)
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report, args.concurrency)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
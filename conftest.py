@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+#
+# テスト共通のフィクスチャ
+#
+
+import sys
+import json
+import threading
+import importlib
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import pytest
+import area
+
+# 天気予報APIの地域定義（primary_area.xml）の一部
+AREA_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:ldWeather="http://weather.livedoor.com/ns/rss/2.0">
+<channel>
+<ldWeather:source title="全国の天気予報">
+<pref title="道北">
+<city title="稚内" id="011000"/>
+<city title="旭川" id="012010"/>
+<city title="留萌" id="012020"/>
+</pref>
+<pref title="道央">
+<city title="札幌" id="016010"/>
+<city title="岩見沢" id="016020"/>
+<city title="倶知安" id="016030"/>
+</pref>
+<pref title="東京都">
+<city title="東京" id="130010"/>
+<city title="大島" id="130020"/>
+<city title="八丈島" id="130030"/>
+<city title="父島" id="130040"/>
+</pref>
+<pref title="京都府">
+<city title="京都" id="260010"/>
+<city title="舞鶴" id="260020"/>
+</pref>
+<pref title="福岡県">
+<city title="福岡" id="400010"/>
+<city title="八幡" id="400020"/>
+<city title="飯塚" id="400030"/>
+<city title="久留米" id="400040"/>
+</pref>
+<pref title="沖縄県">
+<city title="那覇" id="471010"/>
+<city title="名護" id="471020"/>
+<city title="久米島" id="471030"/>
+<city title="南大東" id="472000"/>
+<city title="宮古島" id="473000"/>
+<city title="石垣島" id="474010"/>
+</pref>
+</ldWeather:source>
+</channel>
+</rss>
+""".encode("utf-8")
+
+
+# 地域定義を取得せずに AREA_XML の索引（と対応表）を使う
+@pytest.fixture
+def area_index(monkeypatch):
+    monkeypatch.setattr(area, "_area", None)
+    index = area.build_area_index(AREA_XML)
+    area.set_area_index(index)
+    return index
+
+
+# Messaging API のスタブ。受け取ったリクエストを (パス, JSON) で記録し、fail() で指定したパスにはエラーを返す
+class LineApiStub:
+    def __init__(self):
+        self.requests = []
+        self.errors = {}
+        self.received = threading.Condition()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                with stub.received:
+                    stub.requests.append((self.path, body))
+                    stub.received.notify_all()
+
+                status, response = stub.errors.get(self.path, (200, {}))
+                content = json.dumps(response).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.endpoint = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, name="line-api-stub", daemon=True).start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def fail(self, path, status, response):
+        self.errors[path] = (status, response)
+
+    def reset(self):
+        with self.received:
+            self.requests.clear()
+        self.errors.clear()
+
+    # count 件のリクエストを受け取るまで待って、受け取ったパスの一覧を返す
+    def wait(self, count, timeout=5):
+        with self.received:
+            self.received.wait_for(lambda: len(self.requests) >= count, timeout)
+            return [path for path, _ in self.requests]
+
+
+@pytest.fixture(scope="session")
+def line_api_stub():
+    stub = LineApiStub()
+    stub.start()
+    yield stub
+    stub.stop()
+
+
+# LINE_API_ENDPOINT をスタブに向けて読み込んだ main
+# main は読み込み時に LINE_API_ENDPOINT を読むため、テストモジュールでは直接 import せずにこのフィクスチャを使う
+@pytest.fixture
+def main(line_api_stub, monkeypatch):
+    if "main" not in sys.modules:
+        monkeypatch.setenv('LINE_CHANNEL_SECRET', 'test-channel-secret')
+        monkeypatch.setenv('LINE_CHANNEL_ACCESS_TOKEN', 'test-channel-access-token')
+        monkeypatch.setenv('LINE_API_ENDPOINT', line_api_stub.endpoint)
+        # 読み込み時に地域定義を取得しに行かない
+        monkeypatch.setattr(area, "start_refresher", lambda interval=3600: None)
+    module = importlib.import_module("main")
+    assert module.LINE_API_ENDPOINT == line_api_stub.endpoint
+    line_api_stub.reset()
+    yield module
+    line_api_stub.reset()
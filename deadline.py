@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+#
+# イベントごとの処理期限
+# 返信トークンには有効期限があるため、イベント発生（event.timestamp）から EVENT_DEADLINE 秒以内に返信する。
+# 期限を 住所検索 → リバースジオコーディング → 天気予報取得 → 返信 の各段階に割り振り、
+# 上流APIの呼び出しには段階の残り時間をタイムアウトとして渡す。
+# 時間を使い切った段階は上流APIを呼ばずに打ち切る（DeadlineExceeded）
+#
+# 期限は contextvars で保持するため、スレッド（Flask版）でもコルーチン（asyncio版）でも使える
+#
+
+import os
+import time
+import threading
+import contextvars
+from contextlib import contextmanager
+import requests
+import applog
+
+log = applog.get_logger("deadline")
+
+EVENT_DEADLINE = float(os.getenv('EVENT_DEADLINE', '20'))
+
+# 各段階の持ち時間（EVENT_DEADLINE に対する割合）。前の段階で余った時間は後の段階で使える
+STAGE_SHARES = {
+    "geocode": 0.25,
+    "reverse_geocode": 0.25,
+    "forecast": 0.3,
+    "reply": 0.2,
+}
+
+_current = contextvars.ContextVar("deadline", default=None)
+# 段階 → {"runs": 実行数, "overruns": 持ち時間超過数, "cancelled": 開始前に打ち切った数}
+_stats = {}
+_stats_lock = threading.Lock()
+
+
+# 処理期限を過ぎたため上流APIを呼ばなかった
+class DeadlineExceeded(requests.exceptions.Timeout):
+    pass
+
+
+class Deadline:
+    def __init__(self, budget, age=0.0):
+        self.budget = budget
+        self.expires_at = time.monotonic() + budget - age
+        self.stage = None
+        self.stage_expires_at = self.expires_at
+
+    # イベント全体の残り時間（秒）
+    def remaining(self):
+        return self.expires_at - time.monotonic()
+
+    # 実行中の段階の残り時間（秒）
+    def stage_remaining(self):
+        return min(self.stage_expires_at, self.expires_at) - time.monotonic()
+
+
+# イベントの経過時間（秒）。event.timestamp（ミリ秒）が無い・未来の場合は 0
+def event_age(event):
+    timestamp = getattr(event, "timestamp", None)
+    if not timestamp:
+        return 0.0
+    return min(max(time.time() - timestamp / 1000, 0.0), EVENT_DEADLINE)
+
+
+# イベントの処理期限を設定する
+@contextmanager
+def event(ev=None, budget=None):
+    token = _current.set(Deadline(EVENT_DEADLINE if budget is None else budget, event_age(ev)))
+    try:
+        yield _current.get()
+    finally:
+        _current.reset(token)
+
+
+def current():
+    return _current.get()
+
+
+# 以降の処理を期限なしで行う（プッシュメッセージで後から送る処理など）
+def clear():
+    _current.set(None)
+
+
+def _count(name, key):
+    with _stats_lock:
+        stat = _stats.setdefault(name, {"runs": 0, "overruns": 0, "cancelled": 0})
+        stat[key] += 1
+
+
+# 段階の開始。持ち時間は min(割合 × EVENT_DEADLINE, 残り時間 - 返信用の時間)、返信は残り時間すべて
+# 期限が設定されていない場合（事前取得など）は何もしない
+@contextmanager
+def stage(name):
+    deadline = _current.get()
+    if deadline is None:
+        yield None
+        return
+
+    if name == "reply":
+        allotted = deadline.remaining()
+    else:
+        reserve = deadline.budget * STAGE_SHARES["reply"]
+        allotted = min(deadline.budget * STAGE_SHARES.get(name, 0.0), deadline.remaining() - reserve)
+    if allotted <= 0:
+        _count(name, "cancelled")
+        raise DeadlineExceeded(f"deadline exceeded before stage '{name}'")
+
+    outer = (deadline.stage, deadline.stage_expires_at)
+    start = time.monotonic()
+    deadline.stage, deadline.stage_expires_at = name, start + allotted
+    _count(name, "runs")
+    try:
+        yield deadline
+    finally:
+        deadline.stage, deadline.stage_expires_at = outer
+        elapsed = time.monotonic() - start
+        if elapsed > allotted:
+            _count(name, "overruns")
+            log.warning(f"deadline: stage '{name}' overran its budget ({elapsed:.2f}s > {allotted:.2f}s)")
+
+
+# 上流APIのタイムアウト（秒）。実行中の段階の残り時間と default の短い方
+# 期限が設定されていなければ default、残り時間が無ければ DeadlineExceeded
+def timeout(default=None):
+    deadline = _current.get()
+    if deadline is None:
+        return default
+
+    remaining = deadline.stage_remaining()
+    if remaining <= 0:
+        raise DeadlineExceeded(f"deadline exceeded in stage '{deadline.stage}'")
+    return remaining if default is None else min(default, remaining)
+
+
+def stats():
+    with _stats_lock:
+        return {name: dict(stat) for name, stat in _stats.items()}
@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+#
+# 上流APIのローカル代替サーバー（負荷試験用）
+# 国土地理院の住所検索（AddressSearch）・リバースジオコーダー（LonLatToAddress）、
+# 天気予報APIの地域定義（primary_area.xml）・予報（/api/forecast）を固定データで返す。
+# API ごとに応答遅延の分布・エラー率・タイムアウト（応答しない）率を設定できる
+#
+#   $ python fakeupstream.py --port 8080 --latency lognormal:80:0.6 --latency forecast=fixed:300 \
+#         --error-rate 0.01 --timeout-rate reverse_geocode=0.005
+#   $ ADDRESS_SEARCH_BASE_URL=http://127.0.0.1:8080 REVERSE_GEOCODER_BASE_URL=http://127.0.0.1:8080 \
+#         WEATHER_API_BASE_URL=http://127.0.0.1:8080 python main.py
+#
+# 遅延の指定（ミリ秒）: fixed:平均, uniform:最小:最大, normal:平均:標準偏差,
+#                       lognormal:中央値:シグマ, exp:平均
+# --latency / --error-rate / --timeout-rate は「API名=値」で API ごとに、「値」だけで全体に指定する
+# API名: address_search, reverse_geocode, area, forecast
+#
+
+import sys
+import json
+import math
+import time
+import random
+import hashlib
+import argparse
+import threading
+from collections import Counter
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+SERVICES = ("address_search", "reverse_geocode", "area", "forecast")
+
+# 天気予報の地域定義（一部の地域のみ）
+AREA_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:ldWeather="http://weather.livedoor.com/ns/rss/2.0"><channel>
+<ldWeather:source title="全国の天気予報">
+<pref title="道央"><city title="札幌" id="016010"/></pref>
+<pref title="宮城県"><city title="仙台" id="040010"/></pref>
+<pref title="東京都"><city title="東京" id="130010"/></pref>
+<pref title="愛知県"><city title="名古屋" id="230010"/></pref>
+<pref title="大阪府"><city title="大阪" id="270000"/></pref>
+<pref title="広島県"><city title="広島" id="340010"/></pref>
+<pref title="福岡県"><city title="福岡" id="400010"/></pref>
+<pref title="沖縄県"><city title="那覇" id="471010"/></pref>
+</ldWeather:source></channel></rss>
+""".encode("utf-8")
+AREA_XML_ETAG = '"' + hashlib.sha1(AREA_XML).hexdigest() + '"'
+
+# (地名, 緯度, 経度, 市区町村コード, 都道府県名, 地域名)
+PLACES = [
+    ("札幌市中央区", 43.062, 141.354, "01101", "道央", "札幌"),
+    ("仙台市青葉区", 38.268, 140.870, "04101", "宮城県", "仙台"),
+    ("千代田区", 35.690, 139.692, "13101", "東京都", "東京"),
+    ("名古屋市中区", 35.181, 136.906, "23106", "愛知県", "名古屋"),
+    ("大阪市北区", 34.686, 135.520, "27127", "大阪府", "大阪"),
+    ("広島市中区", 34.396, 132.459, "34101", "広島県", "広島"),
+    ("福岡市中央区", 33.607, 130.418, "40133", "福岡県", "福岡"),
+    ("那覇市", 26.212, 127.681, "47201", "沖縄県", "那覇"),
+]
+CITY_CODES = {"016010": 0, "040010": 1, "130010": 2, "230010": 3, "270000": 4, "340010": 5, "400010": 6, "471010": 7}
+
+
+def _nearest_place(lat, lon):
+    return min(PLACES, key=lambda place: (place[1] - lat) ** 2 + (place[2] - lon) ** 2)
+
+
+def address_search(query):
+    matches = [place for place in PLACES if place[0] in query or place[5] in query] or [PLACES[2]]
+    return [{"geometry": {"coordinates": [place[2], place[1]], "type": "Point"},
+             "type": "Feature", "properties": {"addressCode": "", "title": query}} for place in matches]
+
+
+def reverse_geocode(lat, lon):
+    place = _nearest_place(lat, lon)
+    return {"results": {"muniCd": place[3], "lv01Nm": place[0]}}
+
+
+def weather_forecast(city_code):
+    if city_code not in CITY_CODES:
+        return {"error": "該当する地域が見つかりませんでした"}
+
+    place = PLACES[CITY_CODES[city_code]]
+    today = time.strftime("%Y-%m-%d")
+    return {
+        "publicTime": time.strftime("%Y-%m-%dT05:00:00+09:00"),
+        "title": f"{place[4]} {place[5]} の天気",
+        "description": {"headlineText": "", "text": "晴れ"},
+        "forecasts": [{"date": today, "dateLabel": "今日", "telop": "晴れ"}],
+        "location": {"area": "", "prefecture": place[4], "district": "", "city": place[5]},
+    }
+
+
+# パスに対応する API 名。該当しない場合は None
+def service_for(path):
+    if path.endswith("/address-search/AddressSearch"):
+        return "address_search"
+    if path.endswith("/reverse-geocoder/LonLatToAddress"):
+        return "reverse_geocode"
+    if path.endswith("/primary_area.xml"):
+        return "area"
+    if path.endswith("/api/forecast"):
+        return "forecast"
+    return None
+
+
+def _json(data):
+    return 200, "application/json; charset=utf-8", json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+# 固定データの応答 (ステータスコード, Content-Type, 本文)
+def respond(service, query):
+    try:
+        if service == "address_search":
+            return _json(address_search(query["q"][0]))
+        if service == "reverse_geocode":
+            return _json(reverse_geocode(float(query["lat"][0]), float(query["lon"][0])))
+        if service == "area":
+            return 200, "application/xml", AREA_XML
+        if service == "forecast":
+            return _json(weather_forecast(query["city"][0]))
+    except (KeyError, ValueError):
+        return 400, "text/plain", b"bad request"
+    return 404, "text/plain", b"not found"
+
+
+# 遅延の指定（ミリ秒）から、遅延（秒）を返す関数を作る
+def parse_latency(spec):
+    kind, _, params = spec.partition(":")
+    values = [float(value) for value in params.split(":")] if params else []
+    if kind == "fixed":
+        return lambda rng: values[0] / 1000
+    if kind == "uniform":
+        return lambda rng: rng.uniform(values[0], values[1]) / 1000
+    if kind == "normal":
+        return lambda rng: max(0.0, rng.gauss(values[0], values[1])) / 1000
+    if kind == "lognormal" and values[0] > 0:
+        return lambda rng: rng.lognormvariate(math.log(values[0]), values[1]) / 1000
+    if kind == "exp" and values[0] > 0:
+        return lambda rng: rng.expovariate(1 / values[0]) / 1000
+    raise ValueError(f"unknown latency distribution: '{spec}'")
+
+
+# API ごとの設定
+class Profile:
+    def __init__(self, latency="fixed:0", error_rate=0.0, timeout_rate=0.0):
+        self.latency_spec = latency
+        self.latency = parse_latency(latency)
+        self.error_rate = error_rate
+        self.timeout_rate = timeout_rate
+
+
+class FakeUpstreamHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        parts = urlsplit(self.path)
+        if parts.path == "/_stats":
+            self._send(*_json(server.stats()))
+            return
+
+        service = service_for(parts.path)
+        if service is None:
+            self._send(404, "text/plain", b"not found")
+            return
+
+        profile = server.profiles[service]
+        with server.lock:
+            draw = server.rng.random()
+            delay = profile.latency(server.rng)
+
+        if draw < profile.timeout_rate:
+            # 応答せずに接続を保持し続ける（クライアント側のタイムアウトを発生させる）
+            server.count(service, "timeouts")
+            time.sleep(server.hang)
+            self.close_connection = True
+            return
+
+        time.sleep(delay)
+        if draw < profile.timeout_rate + profile.error_rate:
+            server.count(service, "errors")
+            self._send(503, "text/plain", b"service unavailable")
+            return
+
+        server.count(service, "requests")
+        if service == "area" and self.headers.get("If-None-Match") == AREA_XML_ETAG:
+            self._send(304, None, b"")
+            return
+        self._send(*respond(service, parse_qs(parts.query)))
+
+    def _send(self, status, content_type, body):
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        if status in (200, 304) and self.path.endswith("primary_area.xml"):
+            self.send_header("ETag", AREA_XML_ETAG)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FakeUpstreamServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, profiles=None, hang=30.0, seed=None):
+        super().__init__(address, FakeUpstreamHandler)
+        self.profiles = {service: Profile() for service in SERVICES}
+        self.profiles.update(profiles or {})
+        self.hang = hang
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.counts = Counter()
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, service, kind):
+        with self.lock:
+            self.counts[(service, kind)] += 1
+
+    def stats(self):
+        with self.lock:
+            result = {service: {"requests": 0, "errors": 0, "timeouts": 0} for service in SERVICES}
+            for (service, kind), count in self.counts.items():
+                result[service][kind] = count
+        return result
+
+
+# 代替サーバーをバックグラウンドのスレッドで起動（port=0 の場合は空いているポート）
+def start(port=0, host="127.0.0.1", profiles=None, hang=30.0, seed=None):
+    server = FakeUpstreamServer((host, port), profiles, hang, seed)
+    threading.Thread(target=server.serve_forever, name="fake-upstream", daemon=True).start()
+    return server
+
+
+# 「API名=値」または「値」の指定を API ごとの値にする
+def _per_service(specs, default, convert):
+    values = {service: default for service in SERVICES}
+    for spec in specs or []:
+        service, sep, value = spec.partition("=")
+        if sep and service not in SERVICES:
+            raise ValueError(f"unknown service: '{service}'")
+        for target in ([service] if sep else SERVICES):
+            values[target] = convert(value if sep else spec)
+    return values
+
+
+def build_profiles(latency=None, error_rate=None, timeout_rate=None):
+    latencies = _per_service(latency, "fixed:0", str)
+    error_rates = _per_service(error_rate, 0.0, float)
+    timeout_rates = _per_service(timeout_rate, 0.0, float)
+    return {service: Profile(latencies[service], error_rates[service], timeout_rates[service]) for service in SERVICES}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local stand-in for the GSI and weather forecast APIs.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", action="append", help="[service=]distribution:params (ms)")
+    parser.add_argument("--error-rate", action="append", help="[service=]rate of 503 responses")
+    parser.add_argument("--timeout-rate", action="append", help="[service=]rate of requests left unanswered")
+    parser.add_argument("--hang", type=float, default=30.0, help="seconds to hold unanswered requests")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    profiles = build_profiles(args.latency, args.error_rate, args.timeout_rate)
+    server = FakeUpstreamServer((args.host, args.port), profiles, args.hang, args.seed)
+    print(f"fake upstream listening on {server.base_url}")
+    for service, profile in profiles.items():
+        print(f"  {service:<16} latency={profile.latency_spec} error_rate={profile.error_rate} timeout_rate={profile.timeout_rate}")
+    for name in ("ADDRESS_SEARCH_BASE_URL", "REVERSE_GEOCODER_BASE_URL", "WEATHER_API_BASE_URL"):
+        print(f"export {name}={server.base_url}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
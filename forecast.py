@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+#
+# 天気予報 API（livedoor 天気互換）の予報取得と、都市コード単位の予報キャッシュ
+# 予報は気象庁の発表時刻（5時・11時・17時）にしか更新されないため、
+# キャッシュの有効期限は固定TTLではなく publicTime の次の発表時刻に合わせる
+#
+
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+import upstream
+import singleflight
+import deadline
+import metrics
+import applog
+
+log = applog.get_logger("forecast")
+
+FORECAST_URI = f"{upstream.WEATHER_API_BASE_URL}/api/forecast"
+
+JST = timezone(timedelta(hours=9))
+
+# 気象庁の天気予報発表時刻（時、JST）
+PUBLISH_HOURS = (5, 11, 17)
+# 発表からAPIに反映されるまでの猶予
+PUBLISH_GRACE = timedelta(minutes=10)
+# 発表時刻を過ぎても予報が更新されていない場合の再取得間隔
+RETRY_TTL = timedelta(minutes=5)
+# 天気予報APIの障害時に、期限切れの予報を返してよい期間
+STALE_MAX = timedelta(hours=int(os.getenv('FORECAST_STALE_MAX_HOURS', '24')))
+# 期限切れの予報につける印
+STALE_KEY = "_stale"
+
+forecast_flight = singleflight.Group("forecast")
+
+# 都市コード → (有効期限, 予報データ)
+_forecast_cache = {}
+_forecast_cache_lock = threading.Lock()
+# 都市コード → (publicTime, 整形済みの返信メッセージ)
+_rendered_cache = {}
+_stats = {"hits": 0, "misses": 0, "stale": 0, "rendered_hits": 0, "rendered_misses": 0}
+
+
+def _now():
+    return datetime.now(JST)
+
+
+# 指定日時より後の直近の発表時刻を返す
+def next_publish_time(dt):
+    dt = dt.astimezone(JST)
+    for hour in PUBLISH_HOURS:
+        publish_time = dt.replace(hour=hour, minute=0, second=0, microsecond=0)
+        if publish_time > dt:
+            return publish_time
+
+    next_day = dt + timedelta(days=1)
+    return next_day.replace(hour=PUBLISH_HOURS[0], minute=0, second=0, microsecond=0)
+
+
+# 指定日時以前の直近の発表時刻を返す
+def last_publish_time(dt):
+    dt = dt.astimezone(JST)
+    for hour in reversed(PUBLISH_HOURS):
+        publish_time = dt.replace(hour=hour, minute=0, second=0, microsecond=0)
+        if publish_time <= dt:
+            return publish_time
+
+    previous_day = dt - timedelta(days=1)
+    return previous_day.replace(hour=PUBLISH_HOURS[-1], minute=0, second=0, microsecond=0)
+
+
+# 予報が直近の発表時刻より前のもの（発表が天気予報APIにまだ反映されていない）か
+def is_outdated(weather_data, now=None):
+    now = now or _now()
+    try:
+        public_time = datetime.fromisoformat(weather_data["publicTime"])
+    except (KeyError, TypeError, ValueError):
+        return True
+    return public_time < last_publish_time(now)
+
+
+# 予報データの publicTime から、キャッシュの有効期限を決める
+def forecast_expires_at(weather_data, now=None):
+    now = now or _now()
+    try:
+        public_time = datetime.fromisoformat(weather_data["publicTime"])
+    except (KeyError, TypeError, ValueError):
+        public_time = now
+
+    expires_at = next_publish_time(public_time) + PUBLISH_GRACE
+    if expires_at <= now or is_outdated(weather_data, now):
+        # 次の発表が遅れている。取得し直すまでは前回の予報を返す
+        expires_at = max(expires_at, now + RETRY_TTL)
+    return expires_at
+
+
+def forecast_uri(city_code):
+    return f"{FORECAST_URI}?city={city_code}"
+
+
+# 天気予報APIから都市コードの予報を取得（キャッシュを使わない）
+def fetch_forecast(city_code):
+    return parse_forecast(city_code, upstream.get(forecast_uri(city_code)))
+
+
+# 天気予報APIの応答から予報データを取り出す。エラーの場合は {}（async_main と共用）
+def parse_forecast(city_code, resp_weather):
+    if resp_weather.status_code != 200:
+        log.error(f"fetch_forecast: Weather API call error. \nendpoint={upstream.endpoint(FORECAST_URI)}\ncity code={city_code}\nstatus code={resp_weather.status_code}")
+        return {}
+
+    weather_data = resp_weather.json()
+
+    if "error" in weather_data:
+        log.error(f"fetch_forecast: The specified city ID '{city_code}' is invalid. Error Message:'{weather_data['error']}'")
+        return {}
+
+    return weather_data
+
+
+# 都市コードの予報を取得。有効期限内であればキャッシュから返す
+# 天気予報APIが落ちている場合は、期限切れでも前回の予報を古いことが分かる印をつけて返す
+def get_forecast(city_code):
+    weather_data = get_cached_forecast(city_code)
+    if weather_data is not None:
+        return weather_data
+
+    stale = get_stale_forecast(city_code)
+    if stale is not None and upstream.is_open(FORECAST_URI):
+        # サーキットブレーカーが開いている間は上流を待たない
+        return stale
+
+    try:
+        with deadline.stage("forecast"):
+            # 同じ都市の取得が実行中なら、その結果を待って共有する
+            weather_data = forecast_flight.do(city_code, lambda: _fetch_and_store(city_code),
+                                              timeout=deadline.timeout())
+    except Exception as e:
+        log.error(f"get_forecast: error\n{e}")
+        weather_data = {}
+
+    if len(weather_data) == 0:
+        metrics.error("forecast")
+    if len(weather_data) == 0 and stale is not None:
+        return stale
+    return weather_data
+
+
+# キャッシュの有無にかかわらず天気予報APIから取得し直す（事前取得用）
+def refresh_forecast(city_code):
+    return forecast_flight.do(city_code, lambda: _fetch_and_store(city_code))
+
+
+def _fetch_and_store(city_code):
+    weather_data = fetch_forecast(city_code)
+    if len(weather_data) == 0:
+        return {}
+
+    store_forecast(city_code, weather_data)
+    return weather_data
+
+
+# キャッシュ済みの予報。未取得または期限切れの場合は None
+def get_cached_forecast(city_code):
+    cached = _forecast_cache.get(city_code)
+    with _forecast_cache_lock:
+        if cached is not None and _now() < cached[0]:
+            _stats["hits"] += 1
+            return cached[1]
+        _stats["misses"] += 1
+    return None
+
+
+# 期限切れから STALE_MAX 以内の予報に古い印をつけたもの。無い場合は None
+def get_stale_forecast(city_code):
+    cached = _forecast_cache.get(city_code)
+    if cached is None or _now() >= cached[0] + STALE_MAX:
+        return None
+
+    with _forecast_cache_lock:
+        _stats["stale"] += 1
+    return dict(cached[1], **{STALE_KEY: True})
+
+
+def is_stale(weather_data):
+    return weather_data.get(STALE_KEY, False)
+
+
+def stats():
+    with _forecast_cache_lock:
+        return dict(_stats, cached=len(_forecast_cache))
+
+
+def store_forecast(city_code, weather_data):
+    with _forecast_cache_lock:
+        _forecast_cache[city_code] = (forecast_expires_at(weather_data), weather_data)
+
+        # 予報が更新されたら整形済みのメッセージも捨てる
+        rendered = _rendered_cache.get(city_code)
+        if rendered is not None and rendered[0] != weather_data.get("publicTime"):
+            del _rendered_cache[city_code]
+
+
+def clear_forecast_cache():
+    with _forecast_cache_lock:
+        _forecast_cache.clear()
+        _rendered_cache.clear()
+
+
+# 都市コードの予報を render で整形した結果（返信メッセージ）。同じ都市・同じ発表時刻の予報は一度だけ整形する
+# 都市コードが分からない場合はキャッシュせずに整形する
+def get_rendered(city_code, weather_data, render):
+    public_time = weather_data.get("publicTime")
+
+    with _forecast_cache_lock:
+        rendered = _rendered_cache.get(city_code)
+        if rendered is not None and rendered[0] == public_time:
+            _stats["rendered_hits"] += 1
+            return rendered[1]
+        _stats["rendered_misses"] += 1
+
+    value = render(weather_data)
+    if city_code and public_time is not None:
+        with _forecast_cache_lock:
+            _rendered_cache[city_code] = (public_time, value)
+    return value
@@ -16,21 +16,40 @@ from __future__ import unicode_literals
 
 import os
 import sys
-import requests
+import math
 import urllib
-from lxml import etree
-from flask import Flask, request, abort
+import functools
+import contextvars
+from concurrent import futures
+import requests
+from flask import Flask, request, abort, jsonify, Response
 from linebot import (
     LineBotApi, WebhookHandler
 )
 from linebot.exceptions import (
-    InvalidSignatureError
+    InvalidSignatureError, LineBotApiError
 )
 from linebot.models import (
     MessageEvent, TextMessage, TextSendMessage, LocationMessage, CarouselColumn, TemplateSendMessage, CarouselTemplate,
     ButtonsTemplate, MessageAction,
 )
 import muni
+import area
+import forecast
+import upstream
+import worker
+import revgeo
+import cache
+import query
+import placename
+import prewarm
+import singleflight
+import deadline
+import subscription
+import metrics
+import applog
+
+log = applog.get_logger("main")
 
 app = Flask(__name__)
 
@@ -39,15 +58,58 @@ channel_secret = os.getenv('LINE_CHANNEL_SECRET', None)
 channel_access_token = os.getenv('LINE_CHANNEL_ACCESS_TOKEN', None)
 
 if channel_secret is None:
-    print('Specify LINE_CHANNEL_SECRET as environment variable.')
+    log.error('Specify LINE_CHANNEL_SECRET as environment variable.')
     sys.exit(1)
 if channel_access_token is None:
-    print('Specify LINE_CHANNEL_ACCESS_TOKEN as environment variable.')
+    log.error('Specify LINE_CHANNEL_ACCESS_TOKEN as environment variable.')
     sys.exit(1)
 
-line_bot_api = LineBotApi(channel_access_token)
+# LINE_API_ENDPOINT でMessaging APIの接続先を変更できる（ローカルのスタブで試す場合など）
+LINE_API_ENDPOINT = os.getenv('LINE_API_ENDPOINT', LineBotApi.DEFAULT_API_ENDPOINT)
+
+line_bot_api = LineBotApi(channel_access_token, endpoint=LINE_API_ENDPOINT)
 handler = WebhookHandler(channel_secret)
 
+NG_MESSAGE = "天気予報が取得できませんでした(;><)"
+STALE_NOTE = "\r\n※最新の予報を取得できなかったため、前回取得した予報を表示しています"
+
+# 毎朝の天気予報の配信登録・解除のコマンド
+SUBSCRIBE_COMMAND = "毎朝"
+UNSUBSCRIBE_COMMANDS = ("配信停止", "毎朝停止")
+
+# PUSH_FALLBACK=1 の場合、返信に時間がかかるときは途中経過を返信して、天気予報はプッシュメッセージで送る
+# PUSH_INTERIM_MESSAGE を空にすると途中経過は返信しない
+PUSH_FALLBACK = os.getenv('PUSH_FALLBACK', '0') == '1'
+PUSH_FALLBACK_AFTER = float(os.getenv('PUSH_FALLBACK_AFTER', '1'))
+PUSH_INTERIM_MESSAGE = os.getenv('PUSH_INTERIM_MESSAGE', "天気予報を取得しています。少々お待ちください")
+push_executor = None
+if PUSH_FALLBACK:
+    push_executor = futures.ThreadPoolExecutor(max_workers=int(os.getenv('PUSH_WORKERS', '8')), thread_name_prefix="push")
+
+# 天気予報APIの地域定義をバックグラウンドで定期更新（秒）
+area.start_refresher(int(os.getenv('AREA_REFRESH_INTERVAL', '3600')))
+
+# 市区町村界データ（GeoJSON）を指定した場合、リバースジオコーディングをローカルで行う
+# REVERSE_GEOCODE_API_FALLBACK=0 の場合、データ範囲外でも国土地理院APIを呼ばない
+if os.getenv('MUNI_BOUNDARY_PATH'):
+    revgeo.load_in_background(os.getenv('MUNI_BOUNDARY_PATH'),
+                              os.getenv('MUNI_BOUNDARY_CODE_PROPERTY', revgeo.CODE_PROPERTY))
+reverse_geocode_api_fallback = os.getenv('REVERSE_GEOCODE_API_FALLBACK', '1') == '1'
+
+# リバースジオコーディング結果のキャッシュ
+# 市区町村界データがあれば、緯度・経度を PRECISION 度の格子に丸めたセル単位で保持する
+# 無ければ POINT_PRECISION 度に丸めた地点単位で保持する
+REVERSE_GEOCODE_CACHE_PRECISION = float(os.getenv('REVERSE_GEOCODE_CACHE_PRECISION', '0.01'))
+REVERSE_GEOCODE_POINT_PRECISION = float(os.getenv('REVERSE_GEOCODE_POINT_PRECISION', '0.00001'))
+reverse_geocode_cache = cache.LRUCache(int(os.getenv('REVERSE_GEOCODE_CACHE_SIZE', '10000')))
+
+# 住所検索結果のキャッシュ（正規化したクエリ → 検索結果）
+address_search_cache = cache.LRUCache(int(os.getenv('ADDRESS_SEARCH_CACHE_SIZE', '2000')))
+
+# 同じ地点・同じクエリへの同時リクエストは上流APIを1回だけ呼ぶ
+reverse_geocode_flight = singleflight.Group("reverse_geocode")
+address_search_flight = singleflight.Group("address_search")
+
 
 @app.route("/callback", methods=['POST'])
 def callback():
@@ -56,197 +118,513 @@ def callback():
     # get request body as text
     body = request.get_data(as_text=True)
 
-    # POSTデータをherokuログに出力
-    print("Request body: " + body)
+    # POSTデータをログに出力（LOG_BODY_SAMPLE_RATE の割合だけ。本文は伏せる）
+    applog.log_body(log, body)
 
     # parse webhook body
     try:
-        handler.handle(body, signature)
+        with metrics.timed("signature"):
+            events = handler.parser.parse(body, signature)
+
+        if worker.is_running():
+            # 署名検証とキュー投入のみ行い、処理はワーカースレッドに任せる
+            # キューが満杯のままの場合は、このリクエスト内で処理せずに捨てる（同じ送信元の順序を崩さない）
+            for event in events:
+                if not worker.submit(event):
+                    log.warning("callback: event queue is full, event dropped")
+        else:
+            # 複数イベントは送信元ごとに並行処理する（同じ送信元は受信順）
+            worker.run_batch(dispatch_event, events)
     except InvalidSignatureError:
-        print(InvalidSignatureError)
+        log.warning("callback: invalid signature")
         abort(400)
 
     return 'OK'
 
 
+@app.route("/stats", methods=['GET'])
+def stats():
+    return jsonify(queue=worker.stats(), upstream=upstream.stats(),
+                   reverse_geocode_cache=reverse_geocode_cache.stats(),
+                   address_search_cache=address_search_cache.stats(),
+                   forecast=forecast.stats(),
+                   deadline=deadline.stats(),
+                   prewarm=prewarm.stats(),
+                   log=applog.stats(),
+                   subscription=subscription.stats(),
+                   singleflight={group.name: group.stats() for group in
+                                 (forecast.forecast_flight, reverse_geocode_flight, address_search_flight)})
+
+
+# Prometheus 形式のメトリクス（処理段階ごとの所要時間、エラー数、キャッシュのヒット率、上流APIの呼び出し数）
+@app.route("/metrics", methods=['GET'])
+def metrics_endpoint():
+    forecast_stats = forecast.stats()
+    caches = {
+        "reverse_geocode": reverse_geocode_cache.stats(),
+        "address_search": address_search_cache.stats(),
+        "forecast": forecast_stats,
+        "rendered_message": {"hits": forecast_stats["rendered_hits"], "misses": forecast_stats["rendered_misses"]},
+    }
+    return Response(metrics.render(caches, upstream.stats()), mimetype="text/plain; version=0.0.4")
+
+
+# イベント振り分け
+# 返信トークンの有効期限に合わせて、イベントごとに処理期限を設ける
+# ログにはイベントごとの相関IDを付ける
+def dispatch_event(event):
+    with applog.correlation(applog.event_correlation_id(event)), deadline.event(event), metrics.timed("event"):
+        if isinstance(event, MessageEvent):
+            if isinstance(event.message, TextMessage):
+                handle_message(event)
+            elif isinstance(event.message, LocationMessage):
+                handle_image_message(event)
+
+
 # テキストメッセージハンドラ
-@handler.add(MessageEvent, message=TextMessage)
 def handle_message(event):
-    ng_message = "天気予報が取得できませんでした(;><)"
-    print("callback start")
+    log.debug("callback start")
+    if is_subscription_command(event.message.text):
+        respond(event, lambda: create_messages_from_subscription_command(event.source.user_id, event.message.text))
+        return
+
+    respond(event, lambda: create_messages_from_text(event.message.text))
+
+
+def create_messages_from_text(text):
     try:
         # 検索結果候補
-        geo_info = get_geo_info_from_text(event.message.text)
+        geo_info = get_geo_info_from_text(text)
+        city_code, weather_data = "", {}
         if len(geo_info) == 1:
-            lon, lat = geo_info[0]["geometry"]["coordinates"]
-            weather_data = get_weather_from_geocode(lat, lon)
-            if len(weather_data) == 0:
-                message = ng_message
-            else:
-                message = create_message_from_weather_data(weather_data)
+            city_code, weather_data = get_weather_from_geo_info(geo_info[0])
 
-            messages = TextSendMessage(text=message)
+        return create_messages_from_geo_info(geo_info, weather_data, city_code)
 
-        elif len(geo_info) == 0:
-            message = "該当する住所が見つかりません！\n検索キーワードを見直してください"
-            messages = TextSendMessage(text=message)
+    except Exception as e:
+        log.error(f"handle_message error\n{e}")
+        return TextSendMessage(text=NG_MESSAGE)
+
+
+# 住所検索結果（1件の場合はその地点の天気予報と都市コード）から返信メッセージを生成
+def create_messages_from_geo_info(geo_info, weather_data, city_code=None):
+    if len(geo_info) == 1:
+        return create_messages_from_weather_data(weather_data, city_code)
+
+    elif len(geo_info) == 0:
+        message = "該当する住所が見つかりません！\n検索キーワードを見直してください"
+        return TextSendMessage(text=message)
+
+    elif len(geo_info) > 5:
+        message = "検索結果が多すぎます。。。\n検索キーワードを見直してください"
+        return TextSendMessage(text=message)
+
+    else:
+        actions = []
+        for geo in geo_info:
+            actions.append(MessageAction(
+                label=geo["properties"]["title"],
+                text=geo["properties"]["title"]
+            ))
+        return TemplateSendMessage(
+            alt_text='template',
+            template=ButtonsTemplate(
+                title="位置情報の選択",
+                text="候補を選択してください",
+                actions=actions
+            ),
+        )
+
+
+# 国土地理院の住所検索APIを利用し、住所・地名から位置情報の候補を取得
+# 正規化したクエリ単位でキャッシュし、同じ問い合わせはAPIを呼ばない
+def get_geo_info_from_text(address_text):
+    try:
+        with metrics.timed("address_search"):
+            # 地名だけの問い合わせはローカルの索引で解決する
+            geo_info = placename.search(address_text)
+            if geo_info is not None:
+                return geo_info
+
+            normalized = query.normalize_query(address_text)
+            geo_info = address_search_cache.get(normalized)
+            if geo_info is not None:
+                return geo_info
+
+            with deadline.stage("geocode"):
+                # 同じクエリの検索が実行中なら、その結果を待って共有する
+                return address_search_flight.do(normalized, lambda: search_address(normalized),
+                                                timeout=deadline.timeout())
+    except (TimeoutError, requests.exceptions.Timeout):
+        # 時間切れは「該当する住所が見つかりません」ではなくエラーとして返信する
+        raise
+    except Exception as e:
+        log.error(f"get_weather_from_text error: '{e}'")
+        return {}
 
-        elif len(geo_info) > 5:
-            message = "検索結果が多すぎます。。。\n検索キーワードを見直してください"
-            messages = TextSendMessage(text=message)
 
-        else:
-            actions = []
-            for geo in geo_info:
-                actions.append(MessageAction(
-                    label=geo["properties"]["title"],
-                    text=geo["properties"]["title"]
-                ))
-            messages = TemplateSendMessage(
-                alt_text='template',
-                template=ButtonsTemplate(
-                    title="位置情報の選択",
-                    text="候補を選択してください",
-                    actions=actions
-                ),
-            )
+def search_address(normalized):
+    request_uri = address_search_uri(normalized)
+    resp_data = upstream.get(request_uri)
+    if resp_data.status_code != 200:
+        log.error(f"get_weather_from_text error: Weather area data request error. \nendpoint={upstream.endpoint(request_uri)}\nstatus code={resp_data.status_code}")
+        metrics.error("address_search")
+        return {}
+
+    geo_info = resp_data.json()
+    address_search_cache.put(normalized, geo_info)
+    return geo_info
+
+
+def address_search_uri(address_text):
+    quoted = urllib.parse.quote(address_text)
+    return f"{upstream.ADDRESS_SEARCH_BASE_URL}/address-search/AddressSearch?q={quoted}"
+
+
+# ロケーションメッセージハンドラ
+def handle_image_message(event):
+    respond(event, lambda: create_messages_from_location(event.message.latitude, event.message.longitude))
+
+
+def create_messages_from_location(lat, lon):
+    try:
+        city_code, weather_data = get_weather_from_geocode(lat, lon)
+        return create_messages_from_weather_data(weather_data, city_code)
 
     except Exception as e:
-        print(f"handle_message error\n{e}")
-        messages = TextSendMessage(text=ng_message)
+        log.error(f"handle_image_message error\n{e}")
+        return TextSendMessage(text=NG_MESSAGE)
 
-    line_bot_api.reply_message(
-        event.reply_token,
-        messages=messages)
 
+# create_messages() で作った返信メッセージを送る
+# PUSH_FALLBACK=1 の場合、PUSH_FALLBACK_AFTER 秒以内にできなければ途中経過だけを返信し、
+# できあがったメッセージは後からプッシュメッセージで送る（Webhookの処理を待たせない）
+def respond(event, create_messages):
+    if not PUSH_FALLBACK:
+        reply_message(event.reply_token, create_messages())
+        return
 
-#
-def get_geo_info_from_text(address_text):
+    # 別スレッドではログの相関IDは引き継ぎ、処理期限は引き継がない（返信トークンに間に合わなくてもプッシュで送れる）
+    future = push_executor.submit(contextvars.copy_context().run, _create_messages_without_deadline, create_messages)
+    try:
+        messages = future.result(timeout=PUSH_FALLBACK_AFTER)
+    except futures.TimeoutError:
+        if PUSH_INTERIM_MESSAGE:
+            reply_message(event.reply_token, TextSendMessage(text=PUSH_INTERIM_MESSAGE))
+        future.add_done_callback(functools.partial(_push_when_done, push_target(event)))
+        return
+
+    if not reply_message(event.reply_token, messages):
+        push_message(push_target(event), messages)
+
+
+# 毎朝の天気予報の配信登録（「毎朝 札幌」）・解除（「配信停止」）のコマンドか
+def is_subscription_command(text):
+    text = text.strip()
+    return text.startswith(SUBSCRIBE_COMMAND) or text in UNSUBSCRIBE_COMMANDS
+
+
+def create_messages_from_subscription_command(user_id, text):
+    if not subscription.is_enabled():
+        return TextSendMessage(text="毎朝の天気予報の配信は現在ご利用いただけません")
+    if user_id is None:
+        # グループ・トークルームでは送信者のユーザーIDが分からないことがある
+        return TextSendMessage(text="毎朝の天気予報の配信登録・停止は、1対1のトークで送ってください")
+
+    text = text.strip()
     try:
-        quoted = urllib.parse.quote(address_text)
-        request_uri = f"https://msearch.gsi.go.jp/address-search/AddressSearch?q={quoted}"
-        resp_data = requests.get(request_uri)
-        if resp_data.status_code != 200:
-            print(f"get_weather_from_text error: Weather area data request error. \nURI={request_uri}\nstatus code={resp_data.status_code}")
-            return {}
-
-        return resp_data.json()
+        if text in UNSUBSCRIBE_COMMANDS:
+            if subscription.unsubscribe(user_id):
+                return TextSendMessage(text="毎朝の天気予報の配信を停止しました")
+            return TextSendMessage(text="毎朝の天気予報の配信は登録されていません")
+
+        place = text[len(SUBSCRIBE_COMMAND):].strip()
+        if place == "":
+            return TextSendMessage(text=f"「{SUBSCRIBE_COMMAND} 札幌」のように地名を続けて送ってください")
+
+        geo_info = get_geo_info_from_text(place)
+        if len(geo_info) != 1:
+            return TextSendMessage(text="地点を1つに絞れませんでした。。。\n市区町村名などで指定してください")
+
+        city_code = get_city_code_from_geo_info(geo_info[0])
+        if city_code == "":
+            return TextSendMessage(text=NG_MESSAGE)
+
+        subscription.subscribe(user_id, city_code)
+        title = geo_info[0]["properties"]["title"]
+        return TextSendMessage(text=f"毎朝{subscription.SUBSCRIPTION_DELIVERY_TIME}に「{title}」の天気予報をお送りします\n"
+                                    f"停止するときは「{UNSUBSCRIBE_COMMANDS[0]}」と送ってください")
+
     except Exception as e:
-        print(f"get_weather_from_text error: '{e}'")
-        return {}
+        log.error(f"subscription command error\n{e}")
+        return TextSendMessage(text=NG_MESSAGE)
 
 
-# ロケーションメッセージハンドラ
-@handler.add(MessageEvent, message=LocationMessage)
-def handle_image_message(event):
-    ng_message = "天気予報が取得できませんでした(;><)"
+def _create_messages_without_deadline(create_messages):
+    deadline.clear()
+    return create_messages()
+
+
+# 途中経過を返信した後、できあがったメッセージをプッシュメッセージで送る（作れなかった場合はエラーメッセージ）
+def _push_when_done(to, future):
+    if future.exception() is not None:
+        log.error(f"push fallback error\n{future.exception()}")
+        push_message(to, TextSendMessage(text=NG_MESSAGE))
+        return
+
+    push_message(to, future.result())
+
+
+# 返信。処理期限を使い切っている場合は返信トークンも失効しているため送らずに False
+# 返信トークンの失効などでMessaging APIがエラーを返した場合・通信エラーの場合も False
+def reply_message(reply_token, messages):
     try:
-        weather_data = get_weather_from_geocode(event.message.latitude, event.message.longitude)
-        if len(weather_data) == 0:
-            message = ng_message
-        else:
-            message = create_message_from_weather_data(weather_data)
+        with deadline.stage("reply"), metrics.timed("reply"):
+            line_bot_api.reply_message(reply_token, messages=messages, timeout=deadline.timeout())
+        return True
+    except (LineBotApiError, requests.exceptions.RequestException) as e:
+        # deadline.DeadlineExceeded も requests.exceptions.RequestException に含まれる
+        log.error(f"reply_message error\n{e}")
+        return False
+
+
+# プッシュメッセージの送信先（グループ・トークルームからのメッセージはそこへ送る）
+def push_target(event):
+    source = event.source
+    return getattr(source, "group_id", None) or getattr(source, "room_id", None) or source.user_id
+
 
+def push_message(to, messages):
+    try:
+        line_bot_api.push_message(to, messages=messages)
     except Exception as e:
-        print(f"handle_image_message error\n{e}")
-        message = ng_message
+        log.error(f"push_message error\n{e}")
+
+
+# 複数ユーザーへの送信（毎朝の配信用）。成否を返す
+def multicast(user_ids, messages):
+    try:
+        line_bot_api.multicast(user_ids, messages=messages)
+        return True
+    except Exception as e:
+        log.error(f"multicast error\n{e}")
+        return False
+
+
+# 天気予報情報から返信メッセージを生成（取得できなかった場合はエラーメッセージ）
+# city_code を指定した場合、同じ予報のメッセージは一度だけ整形する（事前取得で整形済みのこともある）
+def create_messages_from_weather_data(weather_data, city_code=None):
+    if len(weather_data) == 0:
+        return TextSendMessage(text=NG_MESSAGE)
 
-    line_bot_api.reply_message(
-        event.reply_token,
-        TextSendMessage(text=message))
+    with metrics.timed("render"):
+        message = forecast.get_rendered(city_code, weather_data, render_message)
+    if forecast.is_stale(weather_data):
+        return TextSendMessage(text=message.text + STALE_NOTE)
+    return message
 
 
 def create_message_from_weather_data(weather_data):
     return f"{weather_data['title']}\r\n{weather_data['forecasts'][0]['date']} : {weather_data['forecasts'][0]['telop']}\r\n{weather_data['description']['headlineText']}"
 
 
-# 国土地理院リバースジオコーダーAPIを利用し、経度、緯度情報から県名を取得
+# 整形済みの天気予報メッセージ
+# 予報ごとにキャッシュし、同じ予報の返信ではメッセージの生成も辞書への変換も行わない
+class RenderedMessage(TextSendMessage):
+    def __init__(self, text):
+        super().__init__(text=text)
+        self.json_dict = super().as_json_dict()
+
+    def as_json_dict(self):
+        return self.json_dict
+
+
+def render_message(weather_data):
+    return RenderedMessage(create_message_from_weather_data(weather_data))
+
+
+# 国土地理院リバースジオコーダーAPIを利用し、経度、緯度情報から市区町村コードを取得
 def reverse_geocode(lat, lon):
     try:
-        req_uri = f"https://mreversegeocoder.gsi.go.jp/reverse-geocoder/LonLatToAddress?lat={lat}&lon={lon}"
-        resp_rev_geo = requests.get(req_uri)
+        # 市区町村界データがあれば、APIを呼ばずにローカルで判定する
+        muni_cd = revgeo.lookup(lat, lon)
+        if muni_cd is not None:
+            muni_cd = validate_muni_cd(muni_cd)
+            if muni_cd != "":
+                return muni_cd
+
+        if not reverse_geocode_api_fallback:
+            log.error("reverse_geocode error. Out of local boundary data.")
+            metrics.error("reverse_geocode")
+            return ""
+
+        req_uri = reverse_geocode_uri(lat, lon)
+        resp_rev_geo = upstream.get(req_uri)
 
         if resp_rev_geo.status_code != 200:
-            print(f"reverse_geocode error\nrequest uri = {req_uri}\nstatus_code={resp_rev_geo.status_code}")
-            return "", ""
+            log.error(f"reverse_geocode error\nendpoint = {upstream.endpoint(req_uri)}\nstatus_code={resp_rev_geo.status_code}")
+            metrics.error("reverse_geocode")
+            return ""
 
         rev_geo_data = resp_rev_geo.json()
         if len(rev_geo_data) == 0:
-            print(f"reverse_geocode error. Invalid get data. latitude = '{lat}', longitude = '{lon}'")
-            return "", ""
+            log.error("reverse_geocode error. Invalid get data.")
+            metrics.error("reverse_geocode")
+            return ""
+
+        muni_cd = validate_muni_cd(rev_geo_data['results']['muniCd'])
+        if muni_cd == "":
+            metrics.error("reverse_geocode")
+        return muni_cd
+
+    except Exception as e:
+        log.error(f"reverse_geocode error\n{e}")
+        metrics.error("reverse_geocode")
+        return ""
+
+
+def reverse_geocode_uri(lat, lon):
+    return f"{upstream.REVERSE_GEOCODER_BASE_URL}/reverse-geocoder/LonLatToAddress?lat={lat}&lon={lon}"
+
 
-        muni_cd = rev_geo_data['results']['muniCd']
-        muni_cd = str(int(muni_cd))  # 先頭の0をカット
+# 市区町村一覧にある市区町村コードか確認し、先頭の0を除いたコードを返す。無効な場合は ""
+def validate_muni_cd(muni_cd):
+    municipality = muni.get(muni_cd)
+    if municipality is None:
+        log.error(f"reverse_geocode error: Invalid muni cd '{muni_cd}'")
+        return ""
 
-        if muni_cd not in muni.MUNI:
-            print(f"reverse_geocode error: Invalid muni cd '{muni_cd}'")
-            return "", ""
+    return municipality.code
 
-        location_info = muni.MUNI[muni_cd].split(",")
-        return location_info[1], location_info[3]
+
+def reverse_geocode_cell(lat, lon, precision=REVERSE_GEOCODE_CACHE_PRECISION):
+    return int(math.floor(float(lat) / precision)), int(math.floor(float(lon) / precision))
+
+
+# キャッシュのキー。市区町村界データがあればセル、無ければ丸めた地点
+def reverse_geocode_key(lat, lon):
+    if revgeo.is_loaded():
+        return reverse_geocode_cell(lat, lon)
+    return ("point", *reverse_geocode_cell(lat, lon, REVERSE_GEOCODE_POINT_PRECISION))
+
+
+# キャッシュ済みの市区町村コード。未登録の場合は None
+def get_cached_muni_cd(lat, lon):
+    return reverse_geocode_cache.get(reverse_geocode_key(lat, lon))
+
+
+# リバースジオコーディング結果をキャッシュする
+#   市区町村界データあり: セルの四隅と中心がすべて同じ市区町村の場合のみ、セル単位で登録する
+#   市区町村界データなし: セル内に市区町村境界が無いことを確かめられないため、丸めた地点単位で登録する
+def store_muni_cd(lat, lon, muni_cd):
+    if muni_cd == "":
+        return
+
+    if revgeo.is_loaded():
+        cell = reverse_geocode_cell(lat, lon)
+        if is_single_muni_cell(cell):
+            reverse_geocode_cache.put(cell, muni_cd)
+        return
+
+    reverse_geocode_cache.put(reverse_geocode_key(lat, lon), muni_cd)
+
+
+def is_single_muni_cell(cell):
+    precision = REVERSE_GEOCODE_CACHE_PRECISION
+    lat0, lon0 = cell[0] * precision, cell[1] * precision
+    points = [(lat0, lon0), (lat0 + precision, lon0), (lat0, lon0 + precision),
+              (lat0 + precision, lon0 + precision), (lat0 + precision / 2, lon0 + precision / 2)]
+    muni_cds = set(revgeo.lookup(lat, lon) for lat, lon in points)
+    return len(muni_cds) == 1 and None not in muni_cds
+
+
+# 住所検索結果1件から (都市コード, 天気予報情報) を取得
+# ローカルの地名索引の結果は位置の代わりに市区町村コード・都市コードを持つ
+def get_weather_from_geo_info(geo):
+    try:
+        properties = geo["properties"]
+        if "cityCode" in properties:
+            with metrics.timed("forecast"):
+                return properties["cityCode"], forecast.get_forecast(properties["cityCode"])
+
+        if "muniCd" in properties:
+            return get_weather_from_muni_cd(properties["muniCd"])
+
+        lon, lat = geo["geometry"]["coordinates"]
+        return get_weather_from_geocode(lat, lon)
 
     except Exception as e:
-        print(f"reverse_geocode error\n{e}")
-        return "", ""
+        log.error(f"get_weather_from_geo_info: error\n{e}")
+        return "", {}
+
+
+# 住所検索結果1件から天気予報の都市コードを取得（配信登録用）。取得できない場合は ""
+def get_city_code_from_geo_info(geo):
+    properties = geo["properties"]
+    if "cityCode" in properties:
+        return properties["cityCode"]
+
+    if "muniCd" in properties:
+        return area.get_city_code(properties["muniCd"])
+
+    lon, lat = geo["geometry"]["coordinates"]
+    muni_cd = get_cached_muni_cd(lat, lon)
+    if muni_cd is None:
+        muni_cd = reverse_geocode(lat, lon)
+        store_muni_cd(lat, lon, muni_cd)
+    if muni_cd == "":
+        return ""
+    return area.get_city_code(muni_cd, lat, lon)
 
 
-# 天気予報 API（livedoor 天気互換）を利用して、県名・市名から天気予報情報を取得
+# 天気予報 API（livedoor 天気互換）を利用して、経度、緯度情報から (都市コード, 天気予報情報) を取得
 def get_weather_from_geocode(lat, lon):
     try:
-        prefecture, city = reverse_geocode(lat, lon)
-        if prefecture == "":
-            return {}
-
-        # 天気予報API用の都市コード取得
-        req_uri = "https://weather.tsukumijima.net/primary_area.xml"
-        resp_area_data = requests.get(req_uri)
-        if resp_area_data.status_code != 200:
-            print(f"get_weather_from_geocode: Weather area data request error. \nURI={req_uri}\nstatus code={resp_area_data.status_code}")
-            return {}
-
-        bytes_data = bytes(bytearray(resp_area_data.text, encoding='utf-8'))
-        xml_obj = etree.XML(bytes_data)
-
-        if prefecture == "北海道":
-            city_list = xml_obj.xpath(".//pref[contains(@title, '道')]/city")
-        else:
-            city_list = xml_obj.xpath(f".//pref[@title='{prefecture}']/city")
+        with metrics.timed("reverse_geocode"):
+            muni_cd = get_cached_muni_cd(lat, lon)
+            if muni_cd is None:
+                with deadline.stage("reverse_geocode"):
+                    muni_cd = reverse_geocode_flight.do((lat, lon), lambda: reverse_geocode(lat, lon),
+                                                        timeout=deadline.timeout())
+                store_muni_cd(lat, lon, muni_cd)
 
-        if len(city_list) == 0:
-            # 都市情報取得失敗
-            print(f"get_weather_from_geocode: The specified prefecture name '{prefecture}' is invalid. ")
-            return {}
+        if muni_cd == "":
+            return "", {}
 
-        # 都市コード取得
-        city_code = ""
-        for c in city_list:
-            if city_code == "":
-                # 都市名が1件もヒットしない場合、最初の都市の予報情報を表示
-                # TODO 市名から候補指定してもらうのもあり
-                city_code = c.get("id")
+        return get_weather_from_muni_cd(muni_cd, lat, lon)
 
-            if c.get("title") in city:
-                city_code = c.get("id")
-                break
+    except Exception as e:
+        log.error(f"get_weather_from_geocode: error\n{e}")
+        return "", {}
 
-        # 天気予報APIリクエスト
-        req_uri = f"https://weather.tsukumijima.net/api/forecast?city={city_code}"
-        resp_weather = requests.get(req_uri)
-        if resp_weather.status_code != 200:
-            print(f"get_weather_from_geocode: Weather API call error. \nURI={req_uri}\nstatus code={resp_weather.status_code}")
-            return {}
 
-        weather_data = resp_weather.json()
+# 市区町村コードから (都市コード, 天気予報情報) を取得
+def get_weather_from_muni_cd(muni_cd, lat=None, lon=None):
+    # 天気予報API用の都市コード取得（市区町村コードとの対応表、または位置から最も近い地域）
+    with metrics.timed("area_lookup"):
+        city_code = area.get_city_code(muni_cd, lat, lon)
+    if city_code == "":
+        log.warning(f"get_weather_from_geocode: No forecast area for muni cd '{muni_cd}'")
+        return "", {}
 
-        if "error" in weather_data:
-            print(f"get_weather_from_geocode: The specified city ID '{city_code}' is invalid. Error Message:'{weather_data['error']}'")
-            return {}
+    # 天気予報APIリクエスト（発表時刻まではキャッシュから返す）
+    with metrics.timed("forecast"):
+        return city_code, forecast.get_forecast(city_code)
 
-        return weather_data
 
-    except Exception as e:
-        print(f"get_weather_from_geocode: error\n{e}")
-        return {}
+# WEBHOOK_ASYNC=1 の場合、Webhookには即座に応答し、イベントはワーカースレッドで処理する
+if os.getenv('WEBHOOK_ASYNC', '0') == '1':
+    worker.start(dispatch_event,
+                 workers=int(os.getenv('WEBHOOK_WORKERS', '4')),
+                 maxsize=int(os.getenv('WEBHOOK_QUEUE_SIZE', '100')))
+
+# FORECAST_PREWARM=1 の場合、予報の発表後に全地域の予報を事前取得する
+if os.getenv('FORECAST_PREWARM', '0') == '1':
+    prewarm.start(render_message)
+
+# SUBSCRIPTION_DELIVERY=1 の場合、毎朝 SUBSCRIPTION_DELIVERY_TIME に登録者へ天気予報を配信する
+if os.getenv('SUBSCRIPTION_DELIVERY', '0') == '1':
+    subscription.start(create_messages_from_weather_data, multicast)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+#
+# 処理段階ごとの所要時間（ヒストグラム）とエラー数
+# 署名検証・住所検索・リバースジオコーディング・地域判定・天気予報取得・メッセージ整形・返信を計測し、
+# キャッシュのヒット率などとあわせて Prometheus のテキスト形式で出力する（/metrics）
+#
+
+import threading
+import time
+from contextlib import contextmanager
+
+# ヒストグラムの区切り（秒）
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+PREFIX = "weatherbot"
+
+# 段階 → {"buckets": 区切りごとの件数, "sum": 合計時間, "count": 件数, "errors": 例外の数}
+_stages = {}
+_lock = threading.Lock()
+
+
+def _stage(name):
+    stage = _stages.get(name)
+    if stage is None:
+        stage = _stages.setdefault(name, {"buckets": [0] * len(BUCKETS), "sum": 0.0, "count": 0, "errors": 0})
+    return stage
+
+
+# 段階の所要時間を記録する
+def observe(name, seconds, error=False):
+    with _lock:
+        stage = _stage(name)
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                stage["buckets"][i] += 1
+                break
+        stage["sum"] += seconds
+        stage["count"] += 1
+        if error:
+            stage["errors"] += 1
+
+
+# 例外にならない失敗（エラー応答・無効なデータなど）を段階 name のエラーとして数える
+def error(name):
+    with _lock:
+        _stage(name)["errors"] += 1
+
+
+# with ブロックの所要時間を段階 name として記録する。例外はエラーとして数える
+@contextmanager
+def timed(name):
+    start = time.perf_counter()
+    error = False
+    try:
+        yield
+    except BaseException:
+        error = True
+        raise
+    finally:
+        observe(name, time.perf_counter() - start, error)
+
+
+def _labels(**labels):
+    return "{" + ",".join(f'{key}="{value}"' for key, value in labels.items()) + "}"
+
+
+def _format_bound(bound):
+    return f"{bound:g}"
+
+
+# Prometheus のテキスト形式
+#   caches: キャッシュ名 → {"hits": ヒット数, "misses": ミス数, ...}
+#   upstreams: ホスト → upstream.stats() の値
+def render(caches=None, upstreams=None):
+    lines = []
+
+    with _lock:
+        stages = {name: {"buckets": list(stage["buckets"]), "sum": stage["sum"],
+                         "count": stage["count"], "errors": stage["errors"]} for name, stage in _stages.items()}
+
+    name = f"{PREFIX}_stage_duration_seconds"
+    lines.append(f"# HELP {name} Latency of each request-handling stage.")
+    lines.append(f"# TYPE {name} histogram")
+    for stage_name, stage in sorted(stages.items()):
+        cumulative = 0
+        for bound, count in zip(BUCKETS, stage["buckets"]):
+            cumulative += count
+            lines.append(f"{name}_bucket{_labels(stage=stage_name, le=_format_bound(bound))} {cumulative}")
+        lines.append(f"{name}_bucket{_labels(stage=stage_name, le='+Inf')} {stage['count']}")
+        lines.append(f"{name}_sum{_labels(stage=stage_name)} {stage['sum']}")
+        lines.append(f"{name}_count{_labels(stage=stage_name)} {stage['count']}")
+
+    name = f"{PREFIX}_stage_errors_total"
+    lines.append(f"# HELP {name} Exceptions raised in each stage.")
+    lines.append(f"# TYPE {name} counter")
+    for stage_name, stage in sorted(stages.items()):
+        lines.append(f"{name}{_labels(stage=stage_name)} {stage['errors']}")
+
+    caches = caches or {}
+    for kind in ("hits", "misses"):
+        name = f"{PREFIX}_cache_{kind}_total"
+        lines.append(f"# HELP {name} Cache {kind}.")
+        lines.append(f"# TYPE {name} counter")
+        for cache_name, stat in sorted(caches.items()):
+            lines.append(f"{name}{_labels(cache=cache_name)} {stat[kind]}")
+
+    name = f"{PREFIX}_cache_hit_ratio"
+    lines.append(f"# HELP {name} Cache hits / (hits + misses).")
+    lines.append(f"# TYPE {name} gauge")
+    for cache_name, stat in sorted(caches.items()):
+        total = stat["hits"] + stat["misses"]
+        lines.append(f"{name}{_labels(cache=cache_name)} {stat['hits'] / total if total else 0.0}")
+
+    upstreams = upstreams or {}
+    for kind, help_text in (("requests", "Upstream API calls."), ("errors", "Upstream API calls that raised or returned 5xx.")):
+        name = f"{PREFIX}_upstream_{kind}_total"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+        for host, stat in sorted(upstreams.items()):
+            lines.append(f"{name}{_labels(host=host)} {stat[kind]}")
+
+    name = f"{PREFIX}_upstream_circuit_open"
+    lines.append(f"# HELP {name} 1 if the upstream circuit breaker is open.")
+    lines.append(f"# TYPE {name} gauge")
+    for host, stat in sorted(upstreams.items()):
+        lines.append(f"{name}{_labels(host=host)} {1 if stat['breaker']['state'] == 'open' else 0}")
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+#
+# 市区町村名・都道府県名・天気予報の地域名のローカル検索索引
+# 地名だけの問い合わせ（「札幌市」「那覇」など）は住所検索APIを呼ばずにここで解決する。
+# 検索結果は住所検索APIと同じ GeoJSON 風の形式（properties.title を持つ Feature のリスト）で返し、
+# 位置の代わりに properties.muniCd（市区町村コード）または properties.cityCode（天気予報の都市コード）を持つ
+#
+
+import re
+import bisect
+import threading
+import muni
+import area
+from query import normalize_query
+
+# 番地など、住所検索APIに任せるべき文字を含むか
+_ADDRESS_PATTERN = re.compile(r"[0-9]|丁目|番地|番|号")
+# 市区町村名の末尾（「那覇」→「那覇市」のように省略して入力される）
+_MUNI_SUFFIX = re.compile(r"(市|町|村|区)$")
+_PREF_SUFFIX = re.compile(r"(都|道|府|県)$")
+# 都道府県名だけの場合に使う地域（未指定の県は最初の地域）
+_PREF_REPRESENTATIVE = {area.HOKKAIDO: "札幌"}
+
+# 作成済みの索引と、その元にした地域定義
+_index = None
+_index_area = None
+_index_lock = threading.Lock()
+
+
+def _key(text):
+    return normalize_query(text)
+
+
+def _bigrams(text):
+    if len(text) < 2:
+        return {text}
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def _muni_feature(prefecture, name, muni_cd):
+    return {
+        "type": "Feature",
+        "geometry": None,
+        "properties": {"title": f"{prefecture}{name}", "muniCd": muni_cd},
+    }
+
+
+def _area_feature(title, city_code):
+    return {
+        "type": "Feature",
+        "geometry": None,
+        "properties": {"title": title, "cityCode": city_code},
+    }
+
+
+# 検索索引を作成
+#   exact: 完全一致用のキー → 候補
+#   keys: 前方一致用にソートしたキーの一覧
+#   ngram: 2文字単位の n-gram → 候補キーの集合
+def build_index(area_index):
+    muni_exact = {}
+    area_exact = {}
+
+    def add(table, key, feature):
+        features = table.setdefault(key, [])
+        if _feature_id(feature) not in map(_feature_id, features):
+            features.append(feature)
+
+    seen = set()
+    for municipality in muni.municipalities():
+        prefecture, muni_cd = municipality.prefecture, municipality.code
+        name = _key(municipality.name)
+        if (prefecture, name) in seen:
+            continue
+        seen.add((prefecture, name))
+
+        feature = _muni_feature(prefecture, name, muni_cd)
+        add(muni_exact, name, feature)
+        add(muni_exact, f"{prefecture}{name}", feature)
+        add(muni_exact, _MUNI_SUFFIX.sub("", name), feature)
+        # 政令指定都市の区は区名だけでも引けるようにする（「札幌市中央区」→「中央区」）
+        if "市" in name[:-1] and name.endswith("区"):
+            add(muni_exact, name[name.index("市") + 1:], feature)
+
+    # 県名付きの地域（市区町村名と同じ地域名を選択肢に出すときの表記。選択するとこの名前で問い合わせが来る）
+    qualified = {}
+    for prefecture, cities in (area_index or {}).items():
+        for city_code, title in cities:
+            add(area_exact, _key(title), _area_feature(title, city_code))
+            qualified[city_code] = _area_feature(f"{prefecture}{title}", city_code)
+            add(area_exact, _key(f"{prefecture}{title}"), qualified[city_code])
+
+        # 都道府県名だけの場合は、その県の代表的な地域の予報
+        if cities and not prefecture.startswith("道"):
+            feature = _area_feature(prefecture, _representative_city_code(prefecture, cities))
+            add(area_exact, prefecture, feature)
+            add(area_exact, _PREF_SUFFIX.sub("", prefecture), feature)
+
+    # 市区町村名と地域名が同じキーは両方を候補にする（「八幡」→ 京都府八幡市と福岡県の地域「八幡」）
+    # ただし市区町村の予報がその地域になる場合（「札幌」→ 札幌市と地域「札幌」）は市区町村だけにする
+    city_codes = area.city_code_table(area_index) if area_index else {}
+    exact = dict(muni_exact)
+    for key, features in area_exact.items():
+        covered = {city_codes.get(feature["properties"]["muniCd"]) for feature in exact.get(key, [])}
+        for feature in features:
+            city_code = feature["properties"]["cityCode"]
+            if city_code in covered:
+                continue
+            if covered and _key(feature["properties"]["title"]) == key:
+                feature = qualified.get(city_code, feature)
+            add(exact, key, feature)
+
+    keys = sorted(exact.keys())
+    ngram = {}
+    for key in keys:
+        for gram in _bigrams(key):
+            ngram.setdefault(gram, set()).add(key)
+
+    return {"exact": exact, "keys": keys, "ngram": ngram}
+
+
+def get_index(fetch=True):
+    global _index, _index_area
+
+    area_index = area.get_area_index(fetch)
+    if _index is not None and _index_area is area_index:
+        return _index
+
+    with _index_lock:
+        if _index is None or _index_area is not area_index:
+            _index = build_index(area_index)
+            _index_area = area_index
+        return _index
+
+
+def _representative_city_code(prefecture, cities):
+    title = _PREF_REPRESENTATIVE.get(prefecture)
+    for city_code, city_title in cities:
+        if city_title == title:
+            return city_code
+    return cities[0][0]
+
+
+# 同じ市区町村・地域を指す候補を区別するための値
+def _feature_id(feature):
+    properties = feature["properties"]
+    return properties.get("muniCd") or properties.get("cityCode")
+
+
+def _unique(features):
+    result = []
+    ids = set()
+    for feature in features:
+        if _feature_id(feature) not in ids:
+            ids.add(_feature_id(feature))
+            result.append(feature)
+    return result
+
+
+# 前方一致で候補を検索
+def search_prefix(text, index=None):
+    index = index or get_index()
+    key = _key(text)
+    keys = index["keys"]
+
+    features = []
+    i = bisect.bisect_left(keys, key)
+    while i < len(keys) and keys[i].startswith(key):
+        features.extend(index["exact"][keys[i]])
+        i += 1
+    return _unique(features)
+
+
+# 2文字単位の n-gram で部分一致の候補を検索
+def search_ngram(text, index=None):
+    index = index or get_index()
+    key = _key(text)
+
+    candidates = None
+    for gram in _bigrams(key):
+        keys = index["ngram"].get(gram, set())
+        candidates = keys if candidates is None else candidates & keys
+        if not candidates:
+            return []
+
+    features = []
+    for candidate in sorted(candidates):
+        if key in candidate:
+            features.extend(index["exact"][candidate])
+    return _unique(features)
+
+
+# 地名の問い合わせをローカルで検索する
+# 完全一致 → 前方一致 → n-gram の順に探し、見つからない場合や番地を含む場合は None（住所検索APIに任せる）
+# 1件に絞れた市区町村が位置から地域を選ぶ市区町村（area.needs_position）の場合も、位置の分かる住所検索APIに任せる
+# fetch=False の場合、地域定義が未読込でも取得しない（読込済みの市区町村名だけで探す）
+def search(text, fetch=True):
+    key = _key(text)
+    if key == "" or _ADDRESS_PATTERN.search(key):
+        return None
+
+    index = get_index(fetch)
+    features = index["exact"].get(key)
+    if not features:
+        features = search_prefix(key, index) or search_ngram(key, index)
+    if not features:
+        return None
+
+    properties = features[0]["properties"]
+    if len(features) == 1 and "muniCd" in properties and area.needs_position(properties["muniCd"], fetch):
+        return None
+    return list(features)
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+#
+# 天気予報の事前取得
+# 予報の発表時刻（5時・11時・17時）の少し後、キャッシュの有効期限が切れる前に全地域の予報を取得し直してキャッシュに載せ、
+# 返信文面も整形しておく。朝の混雑時にユーザーのリクエストが天気予報APIを待たないようにする。
+# 発表がまだ天気予報APIに反映されていない地域は、更新されるまで間隔を空けて取得し直す
+#
+
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+import area
+import forecast
+import applog
+
+log = applog.get_logger("prewarm")
+
+# 同時に取得する地域数
+PREWARM_CONCURRENCY = int(os.getenv('FORECAST_PREWARM_CONCURRENCY', '2'))
+# 1件取得するごとに空ける間隔（秒）。天気予報APIに負荷をかけすぎないため
+PREWARM_INTERVAL = float(os.getenv('FORECAST_PREWARM_INTERVAL', '0.5'))
+# キャッシュの有効期限（発表時刻 + forecast.PUBLISH_GRACE）の何秒前に事前取得を始めるか
+# 全地域を取得し終えるまで、前回の予報をキャッシュから返せるようにする
+PREWARM_MARGIN = timedelta(seconds=float(os.getenv('FORECAST_PREWARM_MARGIN', '180')))
+# 発表時刻から事前取得を始めるまでの時間
+PREWARM_DELAY = max(forecast.PUBLISH_GRACE - PREWARM_MARGIN, timedelta(0))
+# 予報がまだ更新されていない地域を取得し直す間隔（秒）
+# forecast.RETRY_TTL より短くして、キャッシュが切れる前に取得し直す（ユーザーのリクエストに天気予報APIを待たせない）
+PREWARM_RETRY_INTERVAL = float(os.getenv('FORECAST_PREWARM_RETRY_INTERVAL', '240'))
+
+FETCHED = "fetched"
+OUTDATED = "outdated"
+ERROR = "error"
+
+_thread = None
+_stop = threading.Event()
+_last_run = {"started": None, "finished": None, "retry": False, "fetched": 0, "outdated": 0, "errors": 0}
+
+
+# 全地域の都市コード
+def all_city_codes():
+    index = area.get_area_index()
+    if index is None:
+        return []
+
+    city_codes = []
+    for cities in index.values():
+        for city_code, _ in cities:
+            if city_code not in city_codes:
+                city_codes.append(city_code)
+    return city_codes
+
+
+# 1地域の予報を取得して整形しておく。FETCHED, OUTDATED（直近の発表がまだ反映されていない）, ERROR のいずれかを返す
+def _prewarm_one(city_code, render, refresh=False):
+    try:
+        if refresh:
+            weather_data = forecast.refresh_forecast(city_code)
+        else:
+            weather_data = forecast.get_forecast(city_code)
+        if len(weather_data) == 0:
+            return ERROR
+        forecast.get_rendered(city_code, weather_data, render)
+        return OUTDATED if forecast.is_outdated(weather_data) else FETCHED
+    except Exception as e:
+        log.error(f"prewarm error: city_code={city_code}\n{e}")
+        return ERROR
+    finally:
+        time.sleep(PREWARM_INTERVAL)
+
+
+# 全地域の予報をキャッシュの有無にかかわらず取得し直してキャッシュに載せる。render は返信メッセージの整形関数
+# city_codes を指定した場合は、その地域だけを取得し直す。refresh=False の場合はキャッシュにある地域は取得しない
+# 予報がまだ更新されていない・取得できなかった都市コードのリストを返す
+def prewarm_all(render, city_codes=None, refresh=True):
+    retry = city_codes is not None
+    if city_codes is None:
+        city_codes = all_city_codes()
+    _last_run.update(started=datetime.now(forecast.JST), finished=None, retry=retry, fetched=0, outdated=0, errors=0)
+
+    with ThreadPoolExecutor(max_workers=PREWARM_CONCURRENCY, thread_name_prefix="forecast-prewarm") as executor:
+        results = list(executor.map(lambda city_code: _prewarm_one(city_code, render, refresh), city_codes))
+
+    _last_run.update(finished=datetime.now(forecast.JST), fetched=results.count(FETCHED),
+                     outdated=results.count(OUTDATED), errors=results.count(ERROR))
+    log.info(f"prewarm: {results.count(FETCHED)}/{len(city_codes)} forecasts cached, "
+             f"{results.count(OUTDATED)} not yet updated, {results.count(ERROR)} errors")
+    return [city_code for city_code, result in zip(city_codes, results) if result != FETCHED]
+
+
+# 次の事前取得の時刻
+def next_run_time(now):
+    return forecast.next_publish_time(now - PREWARM_DELAY) + PREWARM_DELAY
+
+
+def _scheduler_loop(render):
+    # 起動直後にも一度取得しておく
+    pending = prewarm_all(render, refresh=False)
+    while True:
+        now = datetime.now(forecast.JST)
+        next_run = next_run_time(now)
+        wait = (next_run - now).total_seconds()
+        if pending:
+            # 更新されていない地域は、次の発表時刻を待たずに更新されるまで取得し直す
+            wait = min(wait, PREWARM_RETRY_INTERVAL)
+        if _stop.wait(wait):
+            return
+
+        if datetime.now(forecast.JST) >= next_run:
+            pending = prewarm_all(render)
+        else:
+            pending = prewarm_all(render, pending)
+
+
+# 事前取得のスケジューラを起動（二重起動はしない）
+def start(render):
+    global _thread
+
+    if _thread is not None and _thread.is_alive():
+        return _thread
+
+    _stop.clear()
+    _thread = threading.Thread(target=_scheduler_loop, args=(render,), name="forecast-prewarm-scheduler", daemon=True)
+    _thread.start()
+    return _thread
+
+
+def stop():
+    _stop.set()
+
+
+def stats():
+    return dict(_last_run)
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+#
+# 住所検索クエリの正規化
+# 表記ゆれのある同じ問い合わせ（全角・半角、空白、「〜の天気」、漢数字の丁目など）を同じ文字列にそろえる
+#
+
+import re
+import unicodedata
+
+_KANJI_DIGITS = {"〇": 0, "一": 1, "二": 2, "三": 3, "四": 4, "五": 5, "六": 6, "七": 7, "八": 8, "九": 9}
+
+# 末尾の「の天気」「の天気予報は？」などの問い合わせ表現
+_WEATHER_SUFFIX = re.compile(r"(の)?(天気予報|天気|てんき)(は|を教えて|教えて)?[?!。、.,]*$")
+_CHOME = re.compile(r"([〇一二三四五六七八九十]+)丁目")
+
+
+# 漢数字（九十九まで）を整数に変換
+def kanji_to_int(kanji):
+    if "十" not in kanji:
+        value = 0
+        for c in kanji:
+            value = value * 10 + _KANJI_DIGITS[c]
+        return value
+
+    tens, _, ones = kanji.partition("十")
+    return (_KANJI_DIGITS[tens] if tens else 1) * 10 + (_KANJI_DIGITS[ones] if ones else 0)
+
+
+def _replace_chome(match):
+    try:
+        return f"{kanji_to_int(match.group(1))}丁目"
+    except KeyError:
+        return match.group(0)
+
+
+def normalize_query(text):
+    # 全角英数字・記号を半角に、半角カナを全角にそろえる
+    text = unicodedata.normalize("NFKC", text)
+    text = re.sub(r"\s+", "", text)
+    # 「天気」だけの場合などは地名が残らないので、そのままにする
+    text = _WEATHER_SUFFIX.sub("", text) or text
+    text = _CHOME.sub(_replace_chome, text)
+    return text
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+#
+# オフラインのリバースジオコーダー
+# 市区町村界のGeoJSON（国土数値情報 行政区域データ N03 など）を読み込み、
+# 格子状の空間索引と点の内外判定で緯度・経度から市区町村コードを求める。
+# データ未設定・範囲外の場合は None を返すので、呼び出し側で国土地理院APIにフォールバックする
+#
+
+import json
+import math
+import threading
+import applog
+
+log = applog.get_logger("revgeo")
+
+# 格子の一辺（度）
+GRID_SIZE = 0.1
+
+# 市区町村コードを持つプロパティ名（N03 の場合は行政区域コード）
+CODE_PROPERTY = "N03_007"
+
+# (ポリゴン一覧, 格子索引)。未読込の場合は None
+#   ポリゴン一覧: [(市区町村コード, (min_lon, min_lat, max_lon, max_lat), [リング, ...]), ...]
+#   格子索引: (格子x, 格子y) → ポリゴン番号のリスト
+_index = None
+
+
+def _cell(lon, lat):
+    return int(math.floor(lon / GRID_SIZE)), int(math.floor(lat / GRID_SIZE))
+
+
+def _bbox(rings):
+    xs = [x for ring in rings for x, _ in ring]
+    ys = [y for ring in rings for _, y in ring]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+# 各リングを横切る回数の偶奇で内外判定（穴のあるポリゴンにも対応）
+def _contains(rings, lon, lat):
+    inside = False
+    for ring in rings:
+        j = len(ring) - 1
+        for i in range(len(ring)):
+            xi, yi = ring[i]
+            xj, yj = ring[j]
+            if (yi > lat) != (yj > lat) and lon < (xj - xi) * (lat - yi) / (yj - yi) + xi:
+                inside = not inside
+            j = i
+    return inside
+
+
+def _iter_polygons(geometry):
+    if geometry is None:
+        return
+    if geometry["type"] == "Polygon":
+        yield geometry["coordinates"]
+    elif geometry["type"] == "MultiPolygon":
+        yield from geometry["coordinates"]
+
+
+# GeoJSON（FeatureCollection）から索引を生成
+def build_index(geojson, code_property=CODE_PROPERTY):
+    polygons = []
+    grid = {}
+    for feature in geojson.get("features", []):
+        muni_cd = (feature.get("properties") or {}).get(code_property)
+        if not muni_cd:
+            continue
+
+        for coordinates in _iter_polygons(feature.get("geometry")):
+            rings = [[(float(p[0]), float(p[1])) for p in ring] for ring in coordinates]
+            bbox = _bbox(rings)
+            polygon_id = len(polygons)
+            polygons.append((muni_cd, bbox, rings))
+
+            min_x, min_y = _cell(bbox[0], bbox[1])
+            max_x, max_y = _cell(bbox[2], bbox[3])
+            for x in range(min_x, max_x + 1):
+                for y in range(min_y, max_y + 1):
+                    grid.setdefault((x, y), []).append(polygon_id)
+
+    return polygons, grid
+
+
+# 市区町村界データを読み込む。失敗時は False（APIへのフォールバックのみになる）
+def load(path, code_property=CODE_PROPERTY):
+    global _index
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            index = build_index(json.load(f), code_property)
+    except Exception as e:
+        log.error(f"revgeo load error: '{path}'\n{e}")
+        return False
+
+    _index = index
+    log.info(f"revgeo: loaded {len(index[0])} polygons from '{path}'")
+    return True
+
+
+# 起動を遅らせないよう、別スレッドで読み込む
+def load_in_background(path, code_property=CODE_PROPERTY):
+    thread = threading.Thread(target=load, args=(path, code_property), name="revgeo-loader", daemon=True)
+    thread.start()
+    return thread
+
+
+def is_loaded():
+    return _index is not None
+
+
+# 緯度・経度を含む市区町村のコード。見つからない場合は None
+def lookup(lat, lon):
+    index = _index
+    if index is None:
+        return None
+
+    lat = float(lat)
+    lon = float(lon)
+    polygons, grid = index
+    for polygon_id in grid.get(_cell(lon, lat), []):
+        muni_cd, bbox, rings = polygons[polygon_id]
+        if bbox[0] <= lon <= bbox[2] and bbox[1] <= lat <= bbox[3] and _contains(rings, lon, lat):
+            return muni_cd
+
+    return None
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+#
+# 同じキーの上流API呼び出しをまとめる（single-flight）
+# 実行中の呼び出しと同じキーで呼ばれた場合は、新たに呼び出さずにその結果を待って共有する。
+# 共有する呼び出しは最初の呼び出し元のスレッドで処理期限なしで実行し（タイムアウトは upstream.TIMEOUT）、
+# 後続の呼び出し元は自分の待ち時間だけを区切る
+#
+
+import asyncio
+import threading
+import contextvars
+import deadline
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class Group:
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.coalesced = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    # key の呼び出しが実行中ならその結果を、そうでなければ func() をこのスレッドで実行して結果を返す
+    # timeout（秒）は実行中の呼び出しを待つ時間。それ以上待たずに TimeoutError（func() の実行は続け、結果は後続の呼び出し元が使う）
+    def do(self, key, func, timeout=None):
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self.calls += 1
+                leader = True
+
+        if leader:
+            # 呼び出し元の処理期限は引き継がない（ログの相関IDは引き継ぐ）
+            contextvars.copy_context().run(self._run_detached, key, call, func)
+        elif not call.done.wait(timeout):
+            raise TimeoutError(f"{self.name}: timed out waiting for in-flight call")
+
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def _run(self, key, call, func):
+        try:
+            call.result = func()
+        except Exception as e:
+            call.error = e
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def _run_detached(self, key, call, func):
+        deadline.clear()
+        self._run(key, call, func)
+
+    def stats(self):
+        with self._lock:
+            return {"calls": self.calls, "coalesced": self.coalesced, "in_flight": len(self._calls)}
+
+
+# Group の asyncio 版（同じイベントループ内のコルーチン間でまとめる）
+class AsyncGroup:
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.coalesced = 0
+        self._calls = {}
+
+    async def do(self, key, func):
+        future = self._calls.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.ensure_future(self._run_detached(func))
+        self._calls[key] = future
+        self.calls += 1
+        # 先に待つのをやめた呼び出し元がいても、完了までは後続の呼び出し元と共有する
+        future.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(future)
+
+    def _forget(self, key, future):
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        if not future.cancelled():
+            # 誰も待っていなかった場合の例外の警告を出さない
+            future.exception()
+
+    # タスクは呼び出し元のコンテキストの複製で動くため、処理期限を外しても呼び出し元には影響しない
+    @staticmethod
+    async def _run_detached(func):
+        deadline.clear()
+        return await func()
+
+    def stats(self):
+        return {"calls": self.calls, "coalesced": self.coalesced, "in_flight": len(self._calls)}
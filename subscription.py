@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+#
+# 毎朝の天気予報の配信
+# ユーザーID → 天気予報の都市コード の登録を JSON ファイルに保存し、毎朝 SUBSCRIPTION_DELIVERY_TIME に配信する。
+# 予報・メッセージは地域ごとに一度だけ作り、同じ地域の登録者には multicast でまとめて送る
+#
+
+import os
+import json
+import threading
+from datetime import datetime, timedelta
+import forecast
+import applog
+
+log = applog.get_logger("subscription")
+
+# 登録の保存先。Heroku の dyno のファイルシステムは再起動で消えるため既定値は設けず、
+# 永続化されるディスク上のパスを明示的に指定する。未指定の場合は配信登録を無効にする
+SUBSCRIPTION_PATH = os.getenv('SUBSCRIPTION_PATH')
+# 配信時刻（JST, HH:MM）。5時発表の予報が反映された後にする
+SUBSCRIPTION_DELIVERY_TIME = os.getenv('SUBSCRIPTION_DELIVERY_TIME', "07:00")
+# multicast 1回で送れる宛先の上限
+MULTICAST_LIMIT = 500
+
+# ユーザーID → 都市コード
+_subscriptions = None
+_lock = threading.Lock()
+
+_thread = None
+_stop = threading.Event()
+_last_run = {"started": None, "finished": None, "areas": 0, "recipients": 0, "multicasts": 0, "errors": 0}
+
+
+def is_enabled():
+    return bool(SUBSCRIPTION_PATH)
+
+
+def _load():
+    if not is_enabled():
+        return {}
+    try:
+        with open(SUBSCRIPTION_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def _save():
+    tmp_path = SUBSCRIPTION_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(_subscriptions, f, ensure_ascii=False)
+    os.replace(tmp_path, SUBSCRIPTION_PATH)
+
+
+def _get_subscriptions():
+    global _subscriptions
+
+    if _subscriptions is None:
+        _subscriptions = _load()
+    return _subscriptions
+
+
+# 登録（登録済みの場合は地域を変更）
+def subscribe(user_id, city_code):
+    with _lock:
+        _get_subscriptions()[user_id] = city_code
+        _save()
+
+
+# 登録解除。登録されていなかった場合は False
+def unsubscribe(user_id):
+    with _lock:
+        if _get_subscriptions().pop(user_id, None) is None:
+            return False
+        _save()
+        return True
+
+
+def get_city_code(user_id):
+    with _lock:
+        return _get_subscriptions().get(user_id)
+
+
+# 都市コード → 登録者のユーザーIDの一覧
+def recipients_by_city_code():
+    with _lock:
+        result = {}
+        for user_id, city_code in _get_subscriptions().items():
+            result.setdefault(city_code, []).append(user_id)
+        return result
+
+
+# 登録者に天気予報を配信する
+# create_messages は予報データから返信メッセージを作る関数、multicast(user_ids, messages) は送信関数（成否を返す）
+def deliver(create_messages, multicast):
+    _last_run.update(started=datetime.now(forecast.JST), finished=None, areas=0, recipients=0, multicasts=0, errors=0)
+
+    for city_code, user_ids in recipients_by_city_code().items():
+        weather_data = forecast.get_forecast(city_code)
+        if len(weather_data) == 0:
+            log.warning(f"subscription: No forecast for city code '{city_code}'")
+            _last_run["errors"] += 1
+            continue
+
+        messages = create_messages(weather_data)
+        _last_run["areas"] += 1
+        for i in range(0, len(user_ids), MULTICAST_LIMIT):
+            batch = user_ids[i:i + MULTICAST_LIMIT]
+            if multicast(batch, messages):
+                _last_run["recipients"] += len(batch)
+                _last_run["multicasts"] += 1
+            else:
+                _last_run["errors"] += 1
+
+    _last_run["finished"] = datetime.now(forecast.JST)
+    log.info(f"subscription: delivered to {_last_run['recipients']} users in {_last_run['areas']} areas")
+
+
+# 次の配信時刻
+def next_run_time(now):
+    hour, minute = (int(value) for value in SUBSCRIPTION_DELIVERY_TIME.split(":"))
+    run_time = now.astimezone(forecast.JST).replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if run_time <= now:
+        run_time += timedelta(days=1)
+    return run_time
+
+
+def _scheduler_loop(create_messages, multicast):
+    while True:
+        now = datetime.now(forecast.JST)
+        if _stop.wait((next_run_time(now) - now).total_seconds()):
+            return
+        try:
+            deliver(create_messages, multicast)
+        except Exception as e:
+            log.error(f"subscription error\n{e}")
+
+
+# 配信のスケジューラを起動（二重起動はしない）
+def start(create_messages, multicast):
+    global _thread
+
+    if _thread is not None and _thread.is_alive():
+        return _thread
+    if not is_enabled():
+        log.error("subscription: Specify SUBSCRIPTION_PATH as environment variable.")
+        return None
+
+    _stop.clear()
+    _thread = threading.Thread(target=_scheduler_loop, args=(create_messages, multicast),
+                               name="subscription-scheduler", daemon=True)
+    _thread.start()
+    return _thread
+
+
+def stop():
+    _stop.set()
+
+
+def stats():
+    with _lock:
+        subscribers = len(_get_subscriptions())
+    return dict(_last_run, subscribers=subscribers)
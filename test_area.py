@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+#
+# area（天気予報APIの地域定義と、市区町村コード → 都市コード の対応表）のテスト
+#
+
+import area
+import upstream
+from conftest import AREA_XML
+
+
+class StubResponse:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+def test_build_area_index_groups_hokkaido():
+    index = area.build_area_index(AREA_XML)
+
+    assert index["東京都"][0] == ("130010", "東京")
+    assert [city_code for city_code, _ in index[area.HOKKAIDO]] == ["011000", "012010", "012020", "016010", "016020", "016030"]
+
+
+def test_city_code_table_matches_area_name_in_municipality_name(area_index):
+    table = area.city_code_table(area_index)
+
+    assert table["1100"] == "016010"
+    assert table["1101"] == "016010"
+    assert table["47201"] == "471010"
+    # 地域名を含まない市区町村は県内の最初の地域
+    assert table["26210"] == "260010"
+    # 地域定義に無い県の市区町村は含まない
+    assert "27100" not in table
+
+
+def test_get_city_code(area_index):
+    assert area.get_city_code("01100") == "016010"
+    assert area.get_city_code(13101) == "130010"
+    assert area.get_city_code("27100") == ""
+
+
+def test_get_city_code_without_area_index(monkeypatch):
+    monkeypatch.setattr(area, "_area", None)
+
+    assert area.get_city_code("01100", fetch=False) == ""
+
+
+def test_refresh_publishes_index_with_its_tables(area_index, monkeypatch):
+    xml = AREA_XML.replace(b'id="130010"', b'id="130099"')
+    monkeypatch.setattr(upstream, "get", lambda url, **kwargs: StubResponse(200, xml, {"ETag": '"v2"'}))
+    monkeypatch.setattr(area, "_validators", {"etag": None, "last_modified": None, "content": None})
+
+    assert area.refresh_area_index()
+
+    index, tables = area._area
+    assert index is not area_index
+    assert tables["city_code"]["13101"] == "130099"
+
+    # 対応表は差し替え時に作り終えている（リクエストの処理中には作らない）
+    monkeypatch.setattr(area, "build_city_code_table", None)
+    assert area.get_city_code("13101") == "130099"
+    assert area.city_code_table(index)["13101"] == "130099"
+
+
+def test_refresh_keeps_index_on_not_modified(area_index, monkeypatch):
+    monkeypatch.setattr(upstream, "get", lambda url, **kwargs: StubResponse(304))
+
+    assert not area.refresh_area_index()
+    assert area.get_area_index() is area_index
+
+
+def test_nearest_city_code():
+    points = [("011000", 45.415, 141.673), ("012010", 43.757, 142.372), ("016010", 43.062, 141.354)]
+
+    assert area.nearest_city_code(points, 43.342, 142.383) == "012010"
+    assert area.nearest_city_code(points, "43.1", "141.3") == "016010"
+    assert area.nearest_city_code([], 43.342, 142.383) == ""
+
+
+def test_get_city_code_uses_nearest_area_when_name_does_not_match(area_index):
+    # 富良野市は地域名を含まないため、位置が分かれば最も近い地域（旭川）
+    assert area.needs_position("01229")
+    assert area.get_city_code("01229", 43.342, 142.383) == "012010"
+    assert area.get_city_code("01229") == "011000"
+
+    assert not area.needs_position("01100")
+    assert area.get_city_code("01100", 43.342, 142.383) == "016010"
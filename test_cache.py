@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+#
+# cache.LRUCache のテスト
+#
+
+from cache import LRUCache
+
+
+def test_get_counts_hits_and_misses():
+    lru = LRUCache(2)
+    lru.put("a", 1)
+
+    assert lru.get("a") == 1
+    assert lru.get("b") is None
+    assert lru.get("b", "default") == "default"
+    assert lru.stats() == {"size": 1, "maxsize": 2, "hits": 1, "misses": 2}
+
+
+def test_put_evicts_least_recently_used():
+    lru = LRUCache(2)
+    lru.put("a", 1)
+    lru.put("b", 2)
+    lru.get("a")
+    lru.put("c", 3)
+
+    assert lru.get("b") is None
+    assert lru.get("a") == 1
+    assert lru.get("c") == 3
+    assert len(lru) == 2
+
+
+def test_put_replaces_value():
+    lru = LRUCache(2)
+    lru.put("a", 1)
+    lru.put("a", 2)
+
+    assert lru.get("a") == 2
+    assert len(lru) == 1
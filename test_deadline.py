@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+#
+# deadline（イベントごとの処理期限）のテスト
+#
+
+import types
+import pytest
+import requests
+import deadline
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(deadline, "time", clock)
+    return clock
+
+
+def test_stage_gets_its_share_of_the_budget(clock):
+    with deadline.event(budget=20):
+        with deadline.stage("geocode"):
+            assert deadline.timeout() == pytest.approx(5)
+            assert deadline.timeout(3) == 3
+
+
+def test_later_stage_cannot_use_reply_reserve(clock):
+    with deadline.event(budget=20):
+        clock.now += 13
+        with deadline.stage("forecast"):
+            # 残り7秒のうち返信用の4秒は使わない
+            assert deadline.timeout() == pytest.approx(3)
+
+
+def test_reply_uses_all_remaining_time(clock):
+    with deadline.event(budget=20):
+        clock.now += 18
+        with deadline.stage("reply"):
+            assert deadline.timeout() == pytest.approx(2)
+
+
+def test_stage_is_cancelled_when_only_reply_reserve_is_left(clock):
+    with deadline.event(budget=20):
+        clock.now += 16
+        with pytest.raises(deadline.DeadlineExceeded):
+            with deadline.stage("geocode"):
+                pass
+
+
+def test_timeout_raises_after_stage_budget_is_used(clock):
+    with deadline.event(budget=20):
+        with deadline.stage("geocode"):
+            clock.now += 5
+            with pytest.raises(deadline.DeadlineExceeded):
+                deadline.timeout()
+
+
+def test_event_age_is_taken_from_timestamp(clock):
+    event = types.SimpleNamespace(timestamp=(clock.now - 17) * 1000)
+
+    with deadline.event(event, budget=20) as current:
+        assert current.remaining() == pytest.approx(3)
+        with pytest.raises(deadline.DeadlineExceeded):
+            with deadline.stage("geocode"):
+                pass
+
+
+def test_without_deadline_uses_default():
+    assert deadline.current() is None
+    assert deadline.timeout(5) == 5
+    with deadline.stage("geocode") as current:
+        assert current is None
+
+
+def test_deadline_exceeded_is_a_timeout():
+    assert issubclass(deadline.DeadlineExceeded, requests.exceptions.Timeout)
+
+
+def test_clear_stops_deadline_in_current_context(clock):
+    with deadline.event(budget=20):
+        deadline.clear()
+        assert deadline.timeout(5) == 5
+    assert deadline.current() is None
+
+
+def test_overrun_is_counted(clock, monkeypatch):
+    monkeypatch.setattr(deadline, "_stats", {})
+
+    with deadline.event(budget=20):
+        with deadline.stage("geocode"):
+            clock.now += 6
+
+    assert deadline.stats()["geocode"] == {"runs": 1, "overruns": 1, "cancelled": 0}
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+#
+# forecast（天気予報の取得と、発表時刻に合わせた予報キャッシュ）のテスト
+#
+
+from datetime import datetime, timezone
+import pytest
+import forecast
+
+JST = forecast.JST
+
+
+def jst(day, hour, minute=0):
+    return datetime(2026, 10, day, hour, minute, tzinfo=JST)
+
+
+@pytest.mark.parametrize("now, expected", [
+    (jst(16, 0, 0), jst(16, 5)),
+    (jst(16, 4, 59), jst(16, 5)),
+    (jst(16, 5, 0), jst(16, 11)),
+    (jst(16, 11, 30), jst(16, 17)),
+    (jst(16, 17, 0), jst(17, 5)),
+    (jst(16, 23, 59), jst(17, 5)),
+    # JST以外の日時は JST に直してから決める（UTC 20:30 は翌日の JST 5:30）
+    (datetime(2026, 10, 16, 20, 30, tzinfo=timezone.utc), jst(17, 11)),
+])
+def test_next_publish_time(now, expected):
+    assert forecast.next_publish_time(now) == expected
+
+
+def test_forecast_expires_at_next_publish_time_plus_grace():
+    weather_data = {"publicTime": "2026-10-16T05:00:00+09:00"}
+
+    assert forecast.forecast_expires_at(weather_data, jst(16, 6)) == jst(16, 11, 10)
+    assert forecast.forecast_expires_at({"publicTime": "2026-10-16T17:00:00+09:00"}, jst(16, 18)) == jst(17, 5, 10)
+
+
+def test_forecast_expires_at_retries_when_publication_is_late():
+    weather_data = {"publicTime": "2026-10-16T05:00:00+09:00"}
+    now = jst(16, 11, 20)
+
+    assert forecast.forecast_expires_at(weather_data, now) == now + forecast.RETRY_TTL
+
+
+@pytest.mark.parametrize("weather_data", [{}, {"publicTime": None}, {"publicTime": "invalid"}])
+def test_forecast_expires_at_without_public_time_uses_now(weather_data):
+    assert forecast.forecast_expires_at(weather_data, jst(16, 12)) == jst(16, 17, 10)
+
+
+def test_get_forecast_caches_until_expiry(monkeypatch):
+    now = [jst(16, 6)]
+    fetched = []
+    monkeypatch.setattr(forecast, "_now", lambda: now[0])
+    monkeypatch.setattr(forecast, "fetch_forecast",
+                        lambda city_code: fetched.append(city_code) or {"publicTime": "2026-10-16T05:00:00+09:00"})
+    forecast.clear_forecast_cache()
+    try:
+        forecast.get_forecast("130010")
+        now[0] = jst(16, 11, 9)
+        forecast.get_forecast("130010")
+        assert fetched == ["130010"]
+
+        now[0] = jst(16, 11, 10)
+        forecast.get_forecast("130010")
+        assert fetched == ["130010", "130010"]
+    finally:
+        forecast.clear_forecast_cache()
+
+
+def test_get_rendered_renders_each_forecast_once_per_city():
+    rendered = []
+
+    def render(weather_data):
+        rendered.append(weather_data["title"])
+        return f"rendered {weather_data['title']}"
+
+    forecast.clear_forecast_cache()
+    try:
+        weather_data = {"title": "八幡 の天気", "publicTime": "2026-10-16T05:00:00+09:00"}
+        assert forecast.get_rendered("400020", weather_data, render) == "rendered 八幡 の天気"
+        assert forecast.get_rendered("400020", dict(weather_data), render) == "rendered 八幡 の天気"
+        assert rendered == ["八幡 の天気"]
+
+        # タイトルが同じでも都市が違えば別の予報
+        forecast.get_rendered("260099", weather_data, render)
+        assert len(rendered) == 2
+
+        # 予報が更新されたら整形し直す
+        forecast.get_rendered("400020", dict(weather_data, publicTime="2026-10-16T11:00:00+09:00"), render)
+        assert len(rendered) == 3
+    finally:
+        forecast.clear_forecast_cache()
+
+
+def test_get_rendered_without_city_code_is_not_cached():
+    rendered = []
+    weather_data = {"title": "東京 の天気", "publicTime": "2026-10-16T05:00:00+09:00"}
+
+    forecast.get_rendered(None, weather_data, rendered.append)
+    forecast.get_rendered(None, weather_data, rendered.append)
+
+    assert len(rendered) == 2
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+#
+# placename（地名のローカル検索索引）のテスト
+#
+
+import pytest
+import placename
+
+
+@pytest.fixture(autouse=True)
+def index(area_index, monkeypatch):
+    built = placename.build_index(area_index)
+    monkeypatch.setattr(placename, "get_index", lambda fetch=True: built)
+    return built
+
+
+def titles(features):
+    return [feature["properties"]["title"] for feature in features]
+
+
+def test_search_municipality_name():
+    features = placename.search("札幌市")
+
+    assert titles(features) == ["北海道札幌市"]
+    assert features[0]["properties"]["muniCd"] == "1100"
+    assert features[0]["geometry"] is None
+
+
+def test_search_municipality_without_suffix():
+    assert titles(placename.search("那覇")) == ["沖縄県那覇市"]
+    assert titles(placename.search("　那覇市 ")) == ["沖縄県那覇市"]
+
+
+def test_search_ward_name_is_ambiguous():
+    assert len(placename.search("中央区")) > 1
+    assert titles(placename.search("札幌市中央区")) == ["北海道札幌市中央区"]
+
+
+def test_search_prefecture_uses_representative_area():
+    features = placename.search("東京都")
+
+    assert titles(features) == ["東京都"]
+    assert features[0]["properties"]["cityCode"] == "130010"
+    assert placename.search("北海道")[0]["properties"]["cityCode"] == "016010"
+
+
+def test_search_prefix_and_ngram():
+    assert "北海道札幌市手稲区" in titles(placename.search("札幌市手"))
+    assert titles(placename.search("幌市手稲")) == ["北海道札幌市手稲区"]
+
+
+def test_search_area_covered_by_municipality_returns_municipality_only():
+    assert titles(placename.search("札幌")) == ["北海道札幌市"]
+
+
+def test_search_area_sharing_name_with_municipality_returns_both():
+    features = placename.search("八幡")
+
+    assert titles(features) == ["京都府八幡市", "福岡県八幡"]
+    assert features[1]["properties"]["cityCode"] == "400020"
+    # 選択肢を選ぶと県名付きの地域名で問い合わせが来る
+    assert titles(placename.search("福岡県八幡")) == ["福岡県八幡"]
+
+
+@pytest.mark.parametrize("text", ["", "札幌市中央区北1条西2丁目", "東京都千代田区永田町1-7-1", "存在しない地名ですよ"])
+def test_search_leaves_addresses_and_unknown_names_to_address_search(text):
+    assert placename.search(text) is None
+
+
+def test_search_leaves_position_dependent_municipality_to_address_search():
+    assert placename.search("富良野市") is None
+    assert placename.search("富良野") is None
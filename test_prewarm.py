@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+#
+# prewarm（天気予報の事前取得）のテスト
+#
+
+from datetime import datetime, timedelta
+import pytest
+import forecast
+import prewarm
+
+JST = forecast.JST
+# 天気予報APIの地域数（primary_area.xml）
+AREA_COUNT = 142
+
+
+@pytest.fixture(autouse=True)
+def no_interval(monkeypatch):
+    monkeypatch.setattr(prewarm, "PREWARM_INTERVAL", 0)
+    forecast.clear_forecast_cache()
+    yield
+    forecast.clear_forecast_cache()
+
+
+@pytest.mark.parametrize("hour", forecast.PUBLISH_HOURS)
+def test_prewarm_finishes_before_previous_forecast_expires(hour):
+    publish_time = datetime(2026, 10, 16, hour, tzinfo=JST)
+    previous = {"publicTime": forecast.last_publish_time(publish_time - timedelta(seconds=1)).isoformat()}
+    started = prewarm.next_run_time(publish_time - timedelta(minutes=1))
+    duration = timedelta(seconds=AREA_COUNT * prewarm.PREWARM_INTERVAL / prewarm.PREWARM_CONCURRENCY)
+
+    # 発表前に取得した予報がキャッシュにあるうちに、全地域を取得し終える
+    assert started >= publish_time
+    assert started + duration < forecast.forecast_expires_at(previous, publish_time - timedelta(minutes=1))
+
+
+def test_outdated_forecast_stays_cached_until_retry():
+    started = prewarm.next_run_time(datetime(2026, 10, 16, 4, 59, tzinfo=JST))
+    outdated = {"publicTime": "2026-10-15T17:00:00+09:00"}
+
+    # 発表がまだ反映されていない予報を取得し直した場合も、次に取得し直すまではキャッシュから返す
+    expires_at = forecast.forecast_expires_at(outdated, started)
+    assert expires_at > started + timedelta(seconds=prewarm.PREWARM_RETRY_INTERVAL)
+    assert forecast.forecast_expires_at(outdated, expires_at - timedelta(seconds=1)) > expires_at
+
+
+def test_scheduled_run_refreshes_cached_forecasts(area_index, monkeypatch):
+    now = [datetime(2026, 10, 16, 4, 30, tzinfo=JST)]
+    public_time = ["2026-10-15T17:00:00+09:00"]
+    fetched = []
+    monkeypatch.setattr(forecast, "_now", lambda: now[0])
+    monkeypatch.setattr(forecast, "fetch_forecast", lambda city_code: fetched.append(city_code) or
+                        {"title": city_code, "publicTime": public_time[0]})
+    city_codes = prewarm.all_city_codes()
+
+    assert prewarm.prewarm_all(str, refresh=False) == []
+    assert fetched == city_codes
+
+    # 発表後の事前取得は、キャッシュが有効なうちに取得し直す
+    now[0] = prewarm.next_run_time(now[0])
+    public_time[0] = "2026-10-16T05:00:00+09:00"
+    assert prewarm.prewarm_all(str) == []
+    assert fetched == city_codes * 2
+    assert forecast.get_cached_forecast("130010")["publicTime"] == public_time[0]
+
+
+def test_retry_keeps_outdated_forecast_cached(area_index, monkeypatch):
+    now = [prewarm.next_run_time(datetime(2026, 10, 16, 4, 59, tzinfo=JST))]
+    monkeypatch.setattr(forecast, "_now", lambda: now[0])
+    monkeypatch.setattr(forecast, "fetch_forecast", lambda city_code: {"title": city_code, "publicTime": "2026-10-15T17:00:00+09:00"})
+
+    pending = prewarm.prewarm_all(str)
+    assert pending == prewarm.all_city_codes()
+
+    now[0] += timedelta(seconds=prewarm.PREWARM_RETRY_INTERVAL)
+    assert forecast.get_cached_forecast("130010") is not None
+    assert prewarm.prewarm_all(str, pending) == pending
+    assert prewarm.stats()["retry"]
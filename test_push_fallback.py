@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+#
+# 返信とプッシュメッセージによるフォールバック（main.respond）のテスト
+# Messaging API は LINE_API_ENDPOINT に向けたローカルのスタブ（conftest.LineApiStub）
+#
+
+import time
+import types
+from concurrent import futures
+import pytest
+from linebot.models import TextSendMessage
+
+REPLY = "/v2/bot/message/reply"
+PUSH = "/v2/bot/message/push"
+
+
+@pytest.fixture
+def push_fallback(main, monkeypatch):
+    executor = futures.ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(main, "PUSH_FALLBACK", True)
+    monkeypatch.setattr(main, "PUSH_FALLBACK_AFTER", 0.05)
+    monkeypatch.setattr(main, "push_executor", executor)
+    yield main
+    executor.shutdown(wait=True)
+
+
+def message_event():
+    return types.SimpleNamespace(reply_token="reply-token", timestamp=None,
+                                 source=types.SimpleNamespace(type="user", user_id="U0123"))
+
+
+def texts(body):
+    return [message["text"] for message in body["messages"]]
+
+
+def test_slow_messages_are_pushed_after_interim_reply(push_fallback, line_api_stub):
+    def create_messages():
+        time.sleep(0.3)
+        return TextSendMessage(text="東京都 東京 の天気")
+
+    push_fallback.respond(message_event(), create_messages)
+
+    assert line_api_stub.wait(2) == [REPLY, PUSH]
+    (_, reply), (_, push) = line_api_stub.requests
+    assert reply["replyToken"] == "reply-token"
+    assert texts(reply) == [push_fallback.PUSH_INTERIM_MESSAGE]
+    assert push["to"] == "U0123"
+    assert texts(push) == ["東京都 東京 の天気"]
+
+
+def test_error_after_interim_reply_is_pushed_as_error_message(push_fallback, line_api_stub):
+    def create_messages():
+        time.sleep(0.3)
+        raise RuntimeError("forecast unavailable")
+
+    push_fallback.respond(message_event(), create_messages)
+
+    assert line_api_stub.wait(2) == [REPLY, PUSH]
+    assert texts(line_api_stub.requests[1][1]) == [push_fallback.NG_MESSAGE]
+
+
+def test_expired_reply_token_falls_back_to_push(push_fallback, line_api_stub):
+    line_api_stub.fail(REPLY, 400, {"message": "Invalid reply token"})
+
+    push_fallback.respond(message_event(), lambda: TextSendMessage(text="東京都 東京 の天気"))
+
+    assert line_api_stub.wait(2) == [REPLY, PUSH]
+    assert texts(line_api_stub.requests[1][1]) == ["東京都 東京 の天気"]
+
+
+def test_reply_error_returns_false(main, line_api_stub):
+    line_api_stub.fail(REPLY, 400, {"message": "Invalid reply token"})
+
+    assert not main.reply_message("reply-token", TextSendMessage(text="東京都 東京 の天気"))
+    assert line_api_stub.wait(1) == [REPLY]
+
+
+def test_push_executor_is_created_only_for_push_fallback(main):
+    assert main.PUSH_FALLBACK is False
+    assert main.push_executor is None
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+#
+# query.normalize_query（住所検索クエリの正規化）のテスト
+#
+
+import pytest
+from query import normalize_query, kanji_to_int
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("札幌市", "札幌市"),
+    ("ｻｯﾎﾟﾛ", "サッポロ"),
+    ("　東京都　千代田区 永田町１－７－１ ", "東京都千代田区永田町1-7-1"),
+    ("札幌の天気", "札幌"),
+    ("札幌の天気予報は？", "札幌"),
+    ("那覇　てんき教えて", "那覇"),
+    ("銀座四丁目", "銀座4丁目"),
+    ("西新宿二十三丁目", "西新宿23丁目"),
+])
+def test_normalize_query(text, expected):
+    assert normalize_query(text) == expected
+
+
+def test_normalize_query_keeps_text_without_place_name():
+    assert normalize_query("天気") == "天気"
+
+
+@pytest.mark.parametrize("kanji, value", [
+    ("一", 1), ("九", 9), ("十", 10), ("十一", 11), ("二十", 20), ("九十九", 99), ("一〇", 10),
+])
+def test_kanji_to_int(kanji, value):
+    assert kanji_to_int(kanji) == value
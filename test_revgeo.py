@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+#
+# revgeo（オフラインのリバースジオコーダー）のテスト
+#
+
+import json
+import pytest
+import revgeo
+
+
+def square(min_lon, min_lat, max_lon, max_lat):
+    return [[min_lon, min_lat], [max_lon, min_lat], [max_lon, max_lat], [min_lon, max_lat], [min_lon, min_lat]]
+
+
+def feature(muni_cd, geometry):
+    return {"type": "Feature", "properties": {revgeo.CODE_PROPERTY: muni_cd}, "geometry": geometry}
+
+
+# 市区町村A（穴あき）・その穴を埋める市区町村B・格子をまたぐ飛び地を持つ市区町村C
+GEOJSON = {
+    "type": "FeatureCollection",
+    "features": [
+        feature("01001", {"type": "Polygon", "coordinates": [square(139.0, 35.0, 139.3, 35.3), square(139.1, 35.1, 139.2, 35.2)]}),
+        feature("01002", {"type": "Polygon", "coordinates": [square(139.1, 35.1, 139.2, 35.2)]}),
+        feature("01003", {"type": "MultiPolygon", "coordinates": [[square(139.3, 35.0, 139.6, 35.3)], [square(140.05, 36.05, 140.15, 36.15)]]}),
+        feature(None, {"type": "Polygon", "coordinates": [square(130.0, 30.0, 131.0, 31.0)]}),
+    ],
+}
+
+
+@pytest.fixture(autouse=True)
+def boundaries(tmp_path, monkeypatch):
+    monkeypatch.setattr(revgeo, "_index", None)
+    path = tmp_path / "boundary.geojson"
+    path.write_text(json.dumps(GEOJSON), encoding="utf-8")
+    return str(path)
+
+
+def test_lookup_without_data_returns_none():
+    assert not revgeo.is_loaded()
+    assert revgeo.lookup(35.05, 139.05) is None
+
+
+def test_lookup_finds_containing_municipality(boundaries):
+    assert revgeo.load(boundaries)
+
+    assert revgeo.is_loaded()
+    assert revgeo.lookup(35.05, 139.05) == "01001"
+    assert revgeo.lookup("35.25", "139.25") == "01001"
+    assert revgeo.lookup(35.15, 139.45) == "01003"
+
+
+def test_lookup_respects_holes_and_multipolygons(boundaries):
+    revgeo.load(boundaries)
+
+    # 穴の中は穴を埋める市区町村
+    assert revgeo.lookup(35.15, 139.15) == "01002"
+    # 別の格子にある飛び地
+    assert revgeo.lookup(36.1, 140.1) == "01003"
+
+
+def test_lookup_outside_data_returns_none(boundaries):
+    revgeo.load(boundaries)
+
+    assert revgeo.lookup(35.5, 139.5) is None
+    assert revgeo.lookup(36.2, 140.1) is None
+    # コードの無い地物は索引に入れない
+    assert revgeo.lookup(30.5, 130.5) is None
+
+
+def test_load_failure_keeps_api_fallback(tmp_path):
+    assert not revgeo.load(str(tmp_path / "missing.geojson"))
+    assert not revgeo.is_loaded()
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+#
+# singleflight（同じキーの上流API呼び出しをまとめる）のテスト
+#
+
+import asyncio
+import threading
+import pytest
+import singleflight
+import deadline
+
+
+# 先に呼んだスレッドが func() を実行している間に、後続のスレッドから同じキーで呼ぶ
+def run_concurrently(group, key, func, followers):
+    started = threading.Event()
+    release = threading.Event()
+    results = []
+
+    def leader_func():
+        started.set()
+        release.wait(5)
+        return func()
+
+    def call(f):
+        try:
+            results.append(group.do(key, f))
+        except Exception as e:
+            results.append(e)
+
+    leader = threading.Thread(target=call, args=(leader_func,))
+    leader.start()
+    started.wait(5)
+    threads = [threading.Thread(target=call, args=(lambda: pytest.fail("coalesced call was executed"),))
+               for _ in range(followers)]
+    for thread in threads:
+        thread.start()
+    # 後続のスレッドが待ち始めてから先に呼んだスレッドの処理を終える
+    while group.stats()["calls"] + group.stats()["coalesced"] < followers + 1:
+        threading.Event().wait(0.01)
+    release.set()
+    for thread in [leader] + threads:
+        thread.join(5)
+    return results
+
+
+def test_concurrent_calls_are_coalesced():
+    group = singleflight.Group("test")
+    calls = []
+
+    results = run_concurrently(group, "key", lambda: calls.append(1) or "result", followers=3)
+
+    assert results == ["result"] * 4
+    assert calls == [1]
+    assert group.stats() == {"calls": 1, "coalesced": 3, "in_flight": 0}
+
+
+def test_error_is_shared_with_waiting_callers():
+    group = singleflight.Group("test")
+
+    def fail():
+        raise ValueError("upstream error")
+
+    results = run_concurrently(group, "key", fail, followers=2)
+
+    assert len(results) == 3
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_sequential_and_different_keys_are_not_coalesced():
+    group = singleflight.Group("test")
+
+    assert group.do("a", lambda: 1) == 1
+    assert group.do("a", lambda: 2) == 2
+    assert group.do("b", lambda: 3) == 3
+    assert group.stats() == {"calls": 3, "coalesced": 0, "in_flight": 0}
+
+
+def test_async_concurrent_calls_are_coalesced():
+    group = singleflight.AsyncGroup("test")
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "result"
+
+    async def run():
+        return await asyncio.gather(*[group.do("key", fetch) for _ in range(4)])
+
+    assert asyncio.run(run()) == ["result"] * 4
+    assert calls == [1]
+    assert group.stats() == {"calls": 1, "coalesced": 3, "in_flight": 0}
+
+
+def test_async_error_is_shared():
+    group = singleflight.AsyncGroup("test")
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("upstream error")
+
+    async def run():
+        return await asyncio.gather(*[group.do("key", fail) for _ in range(2)], return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert group.stats()["in_flight"] == 0
+
+
+def test_leader_runs_on_caller_thread_without_deadline():
+    group = singleflight.Group("test")
+    seen = []
+
+    with deadline.event(budget=20):
+        with deadline.stage("geocode"):
+            result = group.do("key", lambda: seen.append((threading.current_thread(), deadline.current())) or "result",
+                              timeout=deadline.timeout())
+
+    assert result == "result"
+    assert seen == [(threading.current_thread(), None)]
+
+
+def test_follower_gives_up_waiting_after_timeout():
+    group = singleflight.Group("test")
+    started = threading.Event()
+    release = threading.Event()
+    leader = threading.Thread(target=group.do, args=("key", lambda: started.set() or release.wait(5) or "result"))
+    leader.start()
+    started.wait(5)
+    try:
+        with pytest.raises(TimeoutError):
+            group.do("key", lambda: pytest.fail("coalesced call was executed"), timeout=0.05)
+    finally:
+        release.set()
+        leader.join(5)
+
+    assert group.stats() == {"calls": 1, "coalesced": 1, "in_flight": 0}
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+#
+# 毎朝の天気予報の配信（subscription）のテスト
+# 送信は main.multicast で LINE_API_ENDPOINT に向けたローカルのスタブ（conftest.LineApiStub）へ送る
+#
+
+import pytest
+import forecast
+import subscription
+
+MULTICAST = "/v2/bot/message/multicast"
+
+
+def weather(city_code):
+    return {
+        "title": f"{city_code} の天気",
+        "publicTime": "2026-10-16T05:00:00+09:00",
+        "forecasts": [{"date": "2026-10-16", "telop": "晴れ"}],
+        "description": {"headlineText": ""},
+    }
+
+
+@pytest.fixture(autouse=True)
+def subscriptions(tmp_path, monkeypatch):
+    monkeypatch.setattr(subscription, "SUBSCRIPTION_PATH", str(tmp_path / "subscriptions.json"))
+    monkeypatch.setattr(subscription, "_subscriptions", None)
+    monkeypatch.setattr(forecast, "get_forecast", weather)
+
+
+def deliver(main):
+    subscription.deliver(main.create_messages_from_weather_data, main.multicast)
+
+
+# スタブが受け取った multicast の (宛先, 本文) の一覧
+def multicasts(line_api_stub):
+    return [(body["to"], body["messages"][0]["text"]) for path, body in line_api_stub.requests if path == MULTICAST]
+
+
+def test_deliver_splits_recipients_into_multicast_limit_batches(main, line_api_stub):
+    for i in range(1003):
+        subscription.subscribe(f"U{i}", "130010")
+
+    deliver(main)
+
+    sent = multicasts(line_api_stub)
+    assert [len(user_ids) for user_ids, _ in sent] == [500, 500, 3]
+    assert sorted(user_id for user_ids, _ in sent for user_id in user_ids) == sorted(f"U{i}" for i in range(1003))
+    stats = subscription.stats()
+    assert (stats["areas"], stats["recipients"], stats["multicasts"], stats["errors"]) == (1, 1003, 3, 0)
+
+
+def test_deliver_groups_recipients_by_area(main, line_api_stub, monkeypatch):
+    subscription.subscribe("U1", "130010")
+    subscription.subscribe("U2", "016010")
+    subscription.subscribe("U3", "130010")
+    fetched = []
+    monkeypatch.setattr(forecast, "get_forecast", lambda city_code: fetched.append(city_code) or weather(city_code))
+
+    deliver(main)
+
+    # 予報は地域ごとに一度だけ取得し、同じ地域の登録者にはまとめて送る
+    assert sorted(fetched) == ["016010", "130010"]
+    assert sorted((text.split(" ")[0], sorted(user_ids)) for user_ids, text in multicasts(line_api_stub)) == [
+        ("016010", ["U2"]), ("130010", ["U1", "U3"])]
+    assert subscription.stats()["areas"] == 2
+
+
+def test_deliver_skips_area_without_forecast(main, line_api_stub, monkeypatch):
+    subscription.subscribe("U1", "130010")
+    subscription.subscribe("U2", "016010")
+    monkeypatch.setattr(forecast, "get_forecast", lambda city_code: {} if city_code == "016010" else weather(city_code))
+
+    deliver(main)
+
+    assert multicasts(line_api_stub) == [(["U1"], "130010 の天気\r\n2026-10-16 : 晴れ\r\n")]
+    stats = subscription.stats()
+    assert (stats["areas"], stats["recipients"], stats["errors"]) == (1, 1, 1)
+
+
+def test_deliver_counts_failed_multicast(main, line_api_stub):
+    for i in range(501):
+        subscription.subscribe(f"U{i}", "130010")
+    line_api_stub.fail(MULTICAST, 500, {"message": "Internal server error"})
+
+    deliver(main)
+
+    # 失敗した送信があっても残りの送信は続ける
+    assert len(multicasts(line_api_stub)) == 2
+    stats = subscription.stats()
+    assert (stats["recipients"], stats["multicasts"], stats["errors"]) == (0, 0, 2)
+    assert stats["subscribers"] == 501
+
+
+def test_subscription_command_requires_user_id(main):
+    message = main.create_messages_from_subscription_command(None, "毎朝 札幌")
+
+    assert "1対1のトーク" in message.text
+    assert subscription.stats()["subscribers"] == 0
+    assert "1対1のトーク" in main.create_messages_from_subscription_command(None, "配信停止").text
+
+
+def test_subscriptions_are_disabled_without_path(monkeypatch):
+    monkeypatch.setattr(subscription, "SUBSCRIPTION_PATH", None)
+
+    assert not subscription.is_enabled()
+    assert subscription.start(lambda weather_data: None, lambda user_ids, messages: True) is None
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+#
+# upstream（上流APIへのHTTPクライアントとサーキットブレーカー）のテスト
+#
+
+import pytest
+import requests
+import upstream
+import deadline
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def perf_counter(self):
+        return self.now
+
+
+class StubSession:
+    def __init__(self, status_code=200):
+        self.status_code = status_code
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        return StubResponse(self.status_code)
+
+
+class StubResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(upstream, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def breaker(clock):
+    return upstream.CircuitBreaker(failures=3, reset=30, slow_call=3)
+
+
+def fail(breaker, times):
+    for _ in range(times):
+        assert breaker.allow()
+        breaker.record(False, 0.1)
+
+
+def test_breaker_opens_after_consecutive_failures(breaker):
+    fail(breaker, 2)
+    assert breaker.state == breaker.CLOSED
+
+    fail(breaker, 1)
+    assert breaker.state == breaker.OPEN
+    assert breaker.is_open()
+    assert not breaker.allow()
+    assert breaker.stats() == {"state": "open", "failures": 3, "opened": 1, "rejected": 1}
+
+
+def test_success_resets_failure_count(breaker):
+    fail(breaker, 2)
+    breaker.record(True, 0.1)
+    fail(breaker, 2)
+
+    assert breaker.state == breaker.CLOSED
+
+
+def test_slow_call_counts_as_failure(breaker):
+    for _ in range(3):
+        breaker.record(True, 3.5)
+
+    assert breaker.state == breaker.OPEN
+
+
+def test_half_open_allows_single_trial_and_closes_on_success(breaker, clock):
+    fail(breaker, 3)
+    clock.now += 30
+
+    assert not breaker.is_open()
+    assert breaker.allow()
+    assert breaker.state == breaker.HALF_OPEN
+    # 試行中は他の呼び出しを止める
+    assert not breaker.allow()
+
+    breaker.record(True, 0.1)
+    assert breaker.state == breaker.CLOSED
+    assert breaker.allow()
+
+
+def test_failed_trial_reopens_breaker(breaker, clock):
+    fail(breaker, 3)
+    clock.now += 30
+
+    assert breaker.allow()
+    breaker.record(False, 0.1)
+
+    assert breaker.state == breaker.OPEN
+    assert breaker.stats()["opened"] == 2
+    clock.now += 29
+    assert not breaker.allow()
+    clock.now += 1
+    assert breaker.allow()
+
+
+def test_get_stops_calling_unhealthy_host(clock, monkeypatch):
+    session = StubSession(503)
+    monkeypatch.setattr(upstream, "_breakers", {})
+    monkeypatch.setattr(upstream, "_stats", {})
+    monkeypatch.setattr(upstream, "get_session", lambda host: session)
+    url = "https://upstream.test/api/forecast?city=130010"
+
+    for _ in range(upstream.BREAKER_FAILURES):
+        assert upstream.get(url).status_code == 503
+    assert upstream.is_open(url)
+
+    with pytest.raises(upstream.CircuitOpenError):
+        upstream.get(url)
+    assert session.calls == upstream.BREAKER_FAILURES
+    assert upstream.stats()["upstream.test"]["breaker"]["state"] == "open"
+
+
+class TimeoutSession:
+    def get(self, url, **kwargs):
+        raise requests.exceptions.ReadTimeout(f"timed out after {kwargs['timeout']}s")
+
+
+def test_timeout_shortened_by_deadline_is_not_judged(clock, monkeypatch):
+    monkeypatch.setattr(upstream, "_breakers", {})
+    monkeypatch.setattr(upstream, "_stats", {})
+    monkeypatch.setattr(upstream, "get_session", lambda host: TimeoutSession())
+    url = "https://upstream.test/api/forecast?city=130010"
+
+    with deadline.event(budget=20):
+        with deadline.stage("geocode"):
+            for _ in range(upstream.BREAKER_FAILURES):
+                with pytest.raises(requests.exceptions.Timeout):
+                    upstream.get(url)
+
+    breaker = upstream.get_breaker("upstream.test")
+    assert breaker.state == breaker.CLOSED
+    assert breaker.failures == 0
+    assert upstream.stats()["upstream.test"]["errors"] == upstream.BREAKER_FAILURES
+
+    # upstream.TIMEOUT まで待った呼び出しは失敗に数える
+    with pytest.raises(requests.exceptions.Timeout):
+        upstream.get(url)
+    assert breaker.failures == 1
+
+
+def test_release_lets_next_call_retry_half_open_trial(breaker, clock):
+    fail(breaker, 3)
+    clock.now += 30
+
+    assert breaker.allow()
+    breaker.release()
+
+    assert breaker.state == breaker.HALF_OPEN
+    assert breaker.allow()
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+#
+# worker（Webhookイベントのワーカースレッドプール）のテスト
+#
+
+import time
+import types
+import threading
+import pytest
+import worker
+
+
+@pytest.fixture(autouse=True)
+def pool(monkeypatch):
+    monkeypatch.setattr(worker, "_queues", [])
+    monkeypatch.setattr(worker, "_threads", [])
+    monkeypatch.setattr(worker, "_stats", dict.fromkeys(worker._stats, 0))
+
+
+def wait_until(condition, timeout=2.0):
+    limit = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < limit
+        time.sleep(0.01)
+
+
+def test_submit_processes_events_on_worker_thread():
+    processed = []
+    worker.start(processed.append, workers=2, maxsize=10)
+
+    assert worker.submit("event")
+    wait_until(lambda: processed == ["event"])
+    assert worker.stats()["enqueued"] == 1
+
+
+def test_submit_drops_event_when_queue_stays_full():
+    release = threading.Event()
+    worker.start(lambda event: release.wait(), workers=1, maxsize=1)
+    try:
+        assert worker.submit("running")
+        wait_until(lambda: worker.stats()["depth"] == 0)
+        assert worker.submit("queued")
+
+        start = time.monotonic()
+        assert not worker.submit("dropped", timeout=0.1)
+        # 空きを待つのは timeout まで。呼び出し元（/callback）で処理はしない
+        assert time.monotonic() - start >= 0.1
+        assert worker.stats()["rejected"] == 1
+    finally:
+        release.set()
+        wait_until(lambda: worker.stats()["processed"] == 2)
+
+
+def message_event(user_id, text, group_id=None):
+    source = types.SimpleNamespace(user_id=user_id, group_id=group_id)
+    return types.SimpleNamespace(source=source, text=text)
+
+
+def test_group_by_source_keeps_order_within_sender():
+    events = [message_event("U1", "a"), message_event("U2", "b"), message_event("U1", "c"),
+              message_event("U1", "d", group_id="G1")]
+
+    groups = worker.group_by_source(events)
+
+    assert [[event.text for event in group] for group in groups] == [["a", "c"], ["b"], ["d"]]
+
+
+def test_run_batch_handles_senders_concurrently_in_order():
+    processed = []
+    both_started = threading.Barrier(2, timeout=2)
+
+    def handle(event):
+        if event.text in ("a1", "b1"):
+            # 送信元が違うイベントは並行して処理される
+            both_started.wait()
+        processed.append(event.text)
+
+    worker.run_batch(handle, [message_event("A", "a1"), message_event("B", "b1"),
+                              message_event("A", "a2"), message_event("B", "b2")])
+
+    assert sorted(processed) == ["a1", "a2", "b1", "b2"]
+    assert processed.index("a1") < processed.index("a2")
+    assert processed.index("b1") < processed.index("b2")
+
+
+def test_submit_keeps_order_of_each_sender():
+    processed = []
+    worker.start(lambda event: processed.append(event.text), workers=4, maxsize=100)
+
+    for i in range(20):
+        assert worker.submit(message_event(f"U{i % 3}", f"{i % 3}:{i}"))
+    wait_until(lambda: len(processed) == 20)
+
+    for user in range(3):
+        texts = [text for text in processed if text.startswith(f"{user}:")]
+        assert texts == [f"{user}:{i}" for i in range(user, 20, 3)]
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+#
+# 上流API（国土地理院、天気予報API）へのHTTPクライアント
+# ホストごとに keep-alive のセッションを1つ持ち、TCP/TLSの接続を使い回す
+#
+
+import os
+import threading
+import time
+import urllib.parse
+import requests
+from requests.adapters import HTTPAdapter
+import deadline
+import applog
+
+log = applog.get_logger("upstream")
+
+# 上流APIの接続先。負荷試験ではローカルの代替サーバー（fakeupstream.py）に向ける
+ADDRESS_SEARCH_BASE_URL = os.getenv('ADDRESS_SEARCH_BASE_URL', "https://msearch.gsi.go.jp").rstrip("/")
+REVERSE_GEOCODER_BASE_URL = os.getenv('REVERSE_GEOCODER_BASE_URL', "https://mreversegeocoder.gsi.go.jp").rstrip("/")
+WEATHER_API_BASE_URL = os.getenv('WEATHER_API_BASE_URL', "https://weather.tsukumijima.net").rstrip("/")
+
+# ホストごとの接続プールの大きさ（同時に保持する接続数）
+POOL_SIZE = int(os.getenv('UPSTREAM_POOL_SIZE', '10'))
+# タイムアウト（秒）。呼び出し側で timeout を指定しない場合に使う
+TIMEOUT = float(os.getenv('UPSTREAM_TIMEOUT', '5'))
+
+# サーキットブレーカー
+# 連続して BREAKER_FAILURES 回失敗（例外・5xx・SLOW_CALL 秒超の応答）するとそのホストへの呼び出しを止め、
+# BREAKER_RESET 秒後に1回だけ試して、成功すれば再開する。
+# イベントの処理期限のために TIMEOUT より短くしたタイムアウトで打ち切った呼び出しは失敗に数えない（上流は健全かもしれない）
+BREAKER_FAILURES = int(os.getenv('UPSTREAM_BREAKER_FAILURES', '5'))
+BREAKER_RESET = float(os.getenv('UPSTREAM_BREAKER_RESET', '30'))
+SLOW_CALL = float(os.getenv('UPSTREAM_SLOW_CALL', '3'))
+
+# ホスト → requests.Session
+_sessions = {}
+# ホスト → 呼び出し統計
+_stats = {}
+# ホスト → CircuitBreaker
+_breakers = {}
+_lock = threading.Lock()
+
+
+# サーキットブレーカーが開いているため呼び出さなかった
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    pass
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failures=BREAKER_FAILURES, reset=BREAKER_RESET, slow_call=SLOW_CALL):
+        self.max_failures = failures
+        self.reset = reset
+        self.slow_call = slow_call
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.open_count = 0
+        self.rejected = 0
+        self._trial = False
+        self._lock = threading.Lock()
+
+    # 呼び出してよいか。開いている間は False（リセット時間経過後は1回だけ試す）
+    def allow(self):
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset:
+                self.state = self.HALF_OPEN
+                self._trial = False
+
+            if self.state == self.HALF_OPEN and not self._trial:
+                self._trial = True
+                return True
+
+            self.rejected += 1
+            return False
+
+    def is_open(self):
+        with self._lock:
+            return self.state == self.OPEN and time.monotonic() - self.opened_at < self.reset
+
+    def record(self, success, elapsed):
+        with self._lock:
+            if success and elapsed <= self.slow_call:
+                self.state = self.CLOSED
+                self.failures = 0
+                return
+
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.max_failures:
+                if self.state != self.OPEN:
+                    self.open_count += 1
+                    log.warning(f"upstream: circuit opened ({self.failures} failures)")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    # 成否を判定しなかった呼び出しの終了。半開状態の試行だった場合は次の呼び出しで試し直す
+    def release(self):
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._trial = False
+
+    def stats(self):
+        with self._lock:
+            return {"state": self.state, "failures": self.failures, "opened": self.open_count, "rejected": self.rejected}
+
+
+def get_breaker(host):
+    breaker = _breakers.get(host)
+    if breaker is not None:
+        return breaker
+
+    with _lock:
+        if host not in _breakers:
+            _breakers[host] = CircuitBreaker()
+        return _breakers[host]
+
+
+# URLのホストへのサーキットブレーカーが開いているか
+def is_open(url):
+    return get_breaker(urllib.parse.urlsplit(url).netloc).is_open()
+
+
+# ログに出す接続先（クエリには住所・座標が入るため、ホストとパスだけにする）
+def endpoint(url):
+    parts = urllib.parse.urlsplit(url)
+    return f"{parts.netloc}{parts.path}"
+
+
+def _new_session():
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# ホスト用のセッションを取得（初回のみ生成）
+def get_session(host):
+    session = _sessions.get(host)
+    if session is not None:
+        return session
+
+    with _lock:
+        if host not in _sessions:
+            _sessions[host] = _new_session()
+        return _sessions[host]
+
+
+# 呼び出し統計に記録する（async_upstream の呼び出しも同じ統計に数える）
+def record(host, elapsed, error):
+    with _lock:
+        stat = _stats.setdefault(host, {"requests": 0, "errors": 0, "elapsed": 0.0})
+        stat["requests"] += 1
+        stat["elapsed"] += elapsed
+        if error:
+            stat["errors"] += 1
+
+
+# requests.get 相当。URLのホストに対応するセッションで送信する
+# サーキットブレーカーが開いている場合は CircuitOpenError、処理期限を過ぎている場合は deadline.DeadlineExceeded
+def get(url, **kwargs):
+    host = urllib.parse.urlsplit(url).netloc
+    session = get_session(host)
+    # イベントの処理期限が設定されていれば、その残り時間をタイムアウトにする
+    shortened = False
+    if "timeout" not in kwargs:
+        kwargs["timeout"] = deadline.timeout(TIMEOUT)
+        shortened = kwargs["timeout"] < TIMEOUT
+    breaker = get_breaker(host)
+    if not breaker.allow():
+        raise CircuitOpenError(f"circuit open: {host}")
+
+    start = time.perf_counter()
+    error = True
+    judged = True
+    try:
+        resp = session.get(url, **kwargs)
+        error = resp.status_code >= 500
+        return resp
+    except requests.exceptions.Timeout:
+        judged = not shortened
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        if judged:
+            breaker.record(not error, elapsed)
+        else:
+            breaker.release()
+        record(host, elapsed, error)
+
+
+# ホストごとの接続統計
+# requests: 送信数, errors: 例外または5xxの数, elapsed: 合計応答時間（秒）,
+# connections: 新規に張った接続数, pooled: 現在プールに保持している接続数（async_upstream の接続は含まない）
+def stats():
+    result = {}
+    with _lock:
+        for host, recorded in _stats.items():
+            stat = dict(recorded)
+            stat["connections"] = 0
+            stat["pooled"] = 0
+            session = _sessions.get(host)
+            for adapter in set(session.adapters.values()) if session is not None else ():
+                for key in adapter.poolmanager.pools.keys():
+                    pool = adapter.poolmanager.pools.get(key)
+                    if pool is None:
+                        continue
+                    stat["connections"] += pool.num_connections
+                    if pool.pool is not None:
+                        stat["pooled"] += sum(1 for conn in list(pool.pool.queue) if conn is not None)
+            result[host] = stat
+        breakers = dict(_breakers)
+
+    for host, breaker in breakers.items():
+        empty = {"requests": 0, "errors": 0, "elapsed": 0.0, "connections": 0, "pooled": 0}
+        result.setdefault(host, empty)["breaker"] = breaker.stats()
+    return result
+
+
+def close():
+    with _lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+        _stats.clear()
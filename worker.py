@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+#
+# Webhookイベントを処理するワーカースレッドプール
+# /callback は署名検証とキュー投入だけを行って即座に応答し、
+# 天気予報の取得・返信はワーカースレッドで行う
+#
+# 同じ送信元のイベントは常に同じワーカーに割り振り、受信順に処理する
+#
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+import applog
+
+log = applog.get_logger("worker")
+
+# 1回のWebhookに含まれる複数イベントを並行処理するスレッド数
+BATCH_WORKERS = int(os.getenv('WEBHOOK_BATCH_WORKERS', '8'))
+# キューが満杯の場合に空きを待つ時間（秒）。待っても空かなければイベントを捨てる
+SUBMIT_TIMEOUT = float(os.getenv('WEBHOOK_SUBMIT_TIMEOUT', '0.5'))
+
+# ワーカーごとのキュー
+_queues = []
+_threads = []
+_lock = threading.Lock()
+_stats = {"enqueued": 0, "rejected": 0, "processed": 0, "errors": 0, "wait_total": 0.0, "wait_max": 0.0}
+
+_batch_executor = None
+
+
+# イベントの送信元キー。グループ・トークルーム内でも発言者ごとに区別する
+def source_key(event):
+    source = getattr(event, "source", None)
+    if source is None:
+        return ""
+
+    chat_id = getattr(source, "group_id", None) or getattr(source, "room_id", None) or ""
+    user_id = getattr(source, "user_id", None) or ""
+    return f"{chat_id}:{user_id}"
+
+
+def _call(func, event):
+    try:
+        func(event)
+        return True
+    except Exception as e:
+        log.error(f"worker error\n{e}")
+        return False
+
+
+def _worker_loop(func, event_queue):
+    while True:
+        enqueued_at, event = event_queue.get()
+        wait_time = time.monotonic() - enqueued_at
+        ok = _call(func, event)
+        with _lock:
+            _stats["processed"] += 1
+            _stats["wait_total"] += wait_time
+            _stats["wait_max"] = max(_stats["wait_max"], wait_time)
+            if not ok:
+                _stats["errors"] += 1
+        event_queue.task_done()
+
+
+# ワーカースレッドを起動。func はイベント1件を処理する関数
+# maxsize はキュー全体の上限で、ワーカーごとに均等に割り当てる
+def start(func, workers=4, maxsize=100):
+    if is_running():
+        return
+
+    shard_size = max(1, -(-maxsize // workers))
+    for i in range(workers):
+        event_queue = queue.Queue(maxsize=shard_size)
+        thread = threading.Thread(target=_worker_loop, args=(func, event_queue), name=f"webhook-worker-{i}", daemon=True)
+        thread.start()
+        _queues.append(event_queue)
+        _threads.append(thread)
+
+
+def is_running():
+    return len(_queues) > 0
+
+
+# イベントをキューに積む。timeout 秒待ってもキューが空かない場合は捨てて False（rejected に数える）
+def submit(event, timeout=SUBMIT_TIMEOUT):
+    event_queue = _queues[hash(source_key(event)) % len(_queues)]
+    try:
+        event_queue.put((time.monotonic(), event), timeout=timeout)
+    except queue.Full:
+        with _lock:
+            _stats["rejected"] += 1
+        return False
+
+    with _lock:
+        _stats["enqueued"] += 1
+    return True
+
+
+# 送信元ごとにイベントをまとめる（送信元内の順序は保持）
+def group_by_source(events):
+    groups = {}
+    for event in events:
+        groups.setdefault(source_key(event), []).append(event)
+    return list(groups.values())
+
+
+def _run_in_order(func, events):
+    for event in events:
+        _call(func, event)
+
+
+# 1回のWebhookのイベントを送信元ごとに並行して処理し、すべて終わるまで待つ
+def run_batch(func, events):
+    global _batch_executor
+
+    groups = group_by_source(events)
+    if len(groups) <= 1:
+        for group in groups:
+            _run_in_order(func, group)
+        return
+
+    if _batch_executor is None:
+        with _lock:
+            if _batch_executor is None:
+                _batch_executor = ThreadPoolExecutor(max_workers=BATCH_WORKERS, thread_name_prefix="webhook-batch")
+
+    wait([_batch_executor.submit(_run_in_order, func, group) for group in groups])
+
+
+# キューの状態
+# depth: 処理待ちのイベント数, wait_avg / wait_max: キュー投入から処理開始までの時間（秒）
+def stats():
+    with _lock:
+        result = dict(_stats)
+    result["depth"] = sum(event_queue.qsize() for event_queue in _queues)
+    result["wait_avg"] = result["wait_total"] / result["processed"] if result["processed"] else 0.0
+    return result